@@ -8,7 +8,9 @@ from typing import List
 from lxml import etree
 
 
-@dataclass
+# Slotted and frozen: entries are built once per card and never mutated, so
+# this keeps attribute access a slot load and halves per-instance footprint
+@dataclass(slots=True, frozen=True)
 class CardEntry:
     number: int
     name: str
@@ -17,7 +19,7 @@ class CardEntry:
     uuid: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CockatriceDeck:
     deckname: str
     zone_main: List[CardEntry] = field(default_factory=list)
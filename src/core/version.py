@@ -1,5 +1,8 @@
 """Version management for Cockatrice Assistant."""
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 # Application version - update this when releasing new versions
 __version__ = "1.1.5"
 __version_info__ = (1, 1, 5)
@@ -24,6 +27,19 @@ def get_version_info() -> tuple:
     return __version_info__
 
 
+@lru_cache(maxsize=64)
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """Parse a version string like "v1.2.3" into a comparable int tuple.
+
+    Returns None when the string cannot be parsed. Memoized so repeated
+    update checks against the same tags parse each string only once.
+    """
+    try:
+        return tuple(map(int, version.lstrip("v").split(".")))
+    except (ValueError, AttributeError):
+        return None
+
+
 def is_newer_version(current: str, latest: str) -> bool:
     """Compare two version strings and determine if latest is newer than current.
 
@@ -34,12 +50,9 @@ def is_newer_version(current: str, latest: str) -> bool:
     Returns:
         True if latest is newer than current
     """
-    try:
-        # Parse version strings into tuples for comparison
-        current_parts = tuple(map(int, current.lstrip("v").split(".")))
-        latest_parts = tuple(map(int, latest.lstrip("v").split(".")))
-
-        return latest_parts > current_parts
-    except (ValueError, AttributeError):
+    current_parts = _parse_version(current)
+    latest_parts = _parse_version(latest)
+    if current_parts is None or latest_parts is None:
         # If parsing fails, assume update is available to be safe
         return True
+    return latest_parts > current_parts
@@ -7,14 +7,19 @@ Features implemented:
 - Template download placeholder
 """
 
+import queue
 import tkinter as tk
 from tkinter import ttk, filedialog
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
+import re
+import traceback
 import webbrowser
 import winreg
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 
 # Add src directory to path for imports when run via main.py
@@ -25,6 +30,7 @@ if str(src_dir) not in sys.path:
 
 from core.deck_parser import write_cod, CockatriceDeck
 from utils.templates import (
+    CockatriceTheme,
     download_template,
     get_curated_themes,
     download_and_install_theme,
@@ -40,7 +46,10 @@ from core.version import APP_NAME, APP_DESCRIPTION, GITHUB_REPO_URL
 
 # Import universal deck import system
 from importers.deck_import import deck_import_manager, convert_universal_to_cockatrice
-import importers.deck_import_init  # This initializes all scrapers
+from importers.deck_import_init import initialize_deck_importers
+
+# Registers scraper factories only; each scraper is built on first use
+initialize_deck_importers()
 
 
 def detect_cockatrice_installation():
@@ -538,13 +547,34 @@ class MainWindow:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
         self.card_items = []  # Track card items for selection
+        # Shared worker pool for download/install jobs so repeated actions
+        # reuse threads (and pooled HTTP connections) instead of spawning
+        # a fresh thread per click
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+        # Pool threads are non-daemon, so closing the window must tear
+        # the pool down or an in-flight download blocks interpreter exit
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.mtgjson_scraper = MTGJsonScraper()
         self.deck_filters = DeckFilters()
         self.precon_decks = []  # List of MTGJSON precon decks
         self.sort_reverse = {}  # Track sort direction for each column
-
-        # Check Cockatrice installation on startup
-        self.root.after(100, self.check_cockatrice_installation)
+        self._status_after_id = None  # Pending status-bar auto-clear timer
+
+        # Worker threads hand results to the GUI through one queue drained
+        # by a single polling after-loop, so chatty updates batch into one
+        # Tcl dispatch instead of a Tcl event per callback
+        self._ui_q = queue.Queue()
+        self.root.after(50, self._drain_ui_q)
+
+        # Run startup I/O checks (installation detect + silent update check)
+        # sequentially on a single background thread instead of spawning one
+        # thread per check while the main thread is still doing layout
+        self.root.after(
+            100,
+            lambda: threading.Thread(
+                target=self._startup_background, daemon=True
+            ).start(),
+        )
 
         # Load cached decks on startup
         self.root.after(200, self.load_initial_decks)
@@ -720,9 +750,6 @@ class MainWindow:
         # Update formats dropdown after loading decks
         self.update_mtgjson_formats()
 
-        # Check for updates on startup (silent check using cache)
-        self.root.after(500, self.check_for_updates_silent)
-
     def load_initial_decks(self):
         """Load decks on app startup, updating cache only if needed."""
         self.import_url_btn.config(state="disabled")
@@ -737,8 +764,7 @@ class MainWindow:
 
                 if cache_is_valid:
                     # Cache is still fresh, use it
-                    self.root.after(
-                        0, lambda: self.status_bar.config(text="Loading from cache...")
+                    self._post_to_ui(lambda: self.status_bar.config(text="Loading from cache...")
                     )
                     decks = self.mtgjson_scraper.fetch_deck_list(force_refresh=False)
                     cache_age_hours = (
@@ -748,22 +774,19 @@ class MainWindow:
                     status_msg = f"Loaded {len(decks)} decks from cache (cache age: {cache_age_hours:.1f}h)"
                 else:
                     # Cache is stale or missing, update it
-                    self.root.after(
-                        0, lambda: self.status_bar.config(text="Updating deck list...")
+                    self._post_to_ui(lambda: self.status_bar.config(text="Updating deck list...")
                     )
                     decks = self.mtgjson_scraper.fetch_deck_list(force_refresh=True)
                     status_msg = f"Updated and loaded {len(decks)} decks from MTGJSON"
 
                 if decks:
                     # Update UI in main thread
-                    self.root.after(0, lambda: self._update_mtgjson_list(decks))
-                    self.root.after(100, self.update_mtgjson_formats)
-                    self.root.after(0, lambda: self.status_bar.config(text=status_msg))
+                    self._post_to_ui(lambda: self._update_mtgjson_list(decks))
+                    self._post_to_ui(self.update_mtgjson_formats)
+                    self._post_to_ui(lambda: self.status_bar.config(text=status_msg))
                 else:
                     # No decks loaded - this shouldn't happen with valid cache
-                    self.root.after(
-                        0,
-                        lambda: self._set_status_message(
+                    self._post_to_ui(lambda: self._set_status_message(
                             "Failed to load deck data. Please check your internet connection.",
                             "error",
                         ),
@@ -776,35 +799,28 @@ class MainWindow:
                         force_refresh=False
                     )
                     if cached_decks:
-                        self.root.after(
-                            0, lambda: self._update_mtgjson_list(cached_decks)
+                        self._post_to_ui(lambda: self._update_mtgjson_list(cached_decks)
                         )
-                        self.root.after(
-                            0,
-                            lambda: self._set_status_message(
+                        self._post_to_ui(lambda: self._set_status_message(
                                 f"Using cached data due to error: {e}",
                                 "warning",
                             ),
                         )
                     else:
-                        self.root.after(
-                            0,
-                            lambda: self._set_status_message(
+                        self._post_to_ui(lambda: self._set_status_message(
                                 f"Could not load decks: {e}",
                                 "error",
                             ),
                         )
                 except Exception as cache_error:
-                    self.root.after(
-                        0,
-                        lambda: self._set_status_message(
+                    self._post_to_ui(lambda: self._set_status_message(
                             f"Failed to load any deck data: {cache_error}",
                             "error",
                         ),
                     )
             finally:
                 # Re-enable buttons
-                self.root.after(0, lambda: self.import_url_btn.config(state="normal"))
+                self._post_to_ui(lambda: self.import_url_btn.config(state="normal"))
 
         threading.Thread(target=load_in_thread, daemon=True).start()
 
@@ -924,9 +940,7 @@ class MainWindow:
                 # Fetch deck using universal import system
                 deck = deck_import_manager.fetch_deck(url)
                 if not deck:
-                    self.root.after(
-                        0,
-                        lambda: self._set_status_message(
+                    self._post_to_ui(lambda: self._set_status_message(
                             f"Failed to fetch deck from {site_name}", "error"
                         ),
                     )
@@ -941,8 +955,7 @@ class MainWindow:
                     error_msg = (
                         "Save directory is empty. Please select a valid directory."
                     )
-                    self.root.after(
-                        0, lambda: self._set_status_message(error_msg, "error")
+                    self._post_to_ui(lambda: self._set_status_message(error_msg, "error")
                     )
                     return
 
@@ -963,8 +976,6 @@ class MainWindow:
                     clean_name = clean_name.replace("__", "_")
 
                 # Sanitize filename for file system safety
-                import re
-
                 # Remove invalid filename characters
                 clean_name = re.sub(r'[<>:"/\\|?*]', "", clean_name)
                 # Limit length to prevent path too long errors
@@ -981,17 +992,13 @@ class MainWindow:
                 write_cod(cockatrice_deck, str(out_path))
                 print(f"Successfully wrote file: {out_path}")
 
-                self.root.after(
-                    0,
-                    lambda: self._set_status_message(
+                self._post_to_ui(lambda: self._set_status_message(
                         f"Successfully imported '{deck.name}' from {site_name} to {out_path}",
                         "success",
                     ),
                 )
 
             except Exception as e:
-                import traceback
-
                 # Get more detailed error information
                 error_details = traceback.format_exc()
                 print(f"Import error details:\n{error_details}")
@@ -1007,39 +1014,68 @@ class MainWindow:
                 else:
                     error_msg = f"Import failed: {e}"
 
-                self.root.after(0, lambda: self._set_status_message(error_msg, "error"))
+                self._post_to_ui(lambda: self._set_status_message(error_msg, "error"))
             finally:
-                self.root.after(
-                    0,
-                    lambda: self.import_url_btn.config(
+                self._post_to_ui(lambda: self.import_url_btn.config(
                         text="Import from URL", state="normal"
                     ),
                 )
 
         threading.Thread(target=import_in_thread, daemon=True).start()
 
+    def _post_to_ui(self, fn, *args):
+        """Queue a callable to run on the GUI thread (safe from any thread)."""
+        self._ui_q.put((fn, args))
+
+    def _drain_ui_q(self):
+        """Dispatch queued worker results in batches on the GUI thread."""
+        for _ in range(100):
+            try:
+                fn, args = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Error dispatching UI callback: {e}")
+        self.root.after(50, self._drain_ui_q)
+
+    def _startup_background(self):
+        """Run startup I/O checks sequentially on one background thread."""
+        try:
+            is_installed, install_path = detect_cockatrice_installation()
+            self._post_to_ui(self._apply_cockatrice_status, is_installed, install_path
+            )
+        except Exception:
+            self._post_to_ui(self._apply_cockatrice_status, None, None)
+
+        self._silent_update_check_core()
+
     def check_cockatrice_installation(self):
         """Check if Cockatrice is installed and update the UI accordingly."""
         try:
             is_installed, install_path = detect_cockatrice_installation()
+        except Exception:
+            is_installed, install_path = None, None
+        self._apply_cockatrice_status(is_installed, install_path)
 
-            if is_installed:
-                self.cockatrice_status_label.config(
-                    text=f"✓ Cockatrice found: {install_path}", foreground="green"
-                )
-                self.get_cockatrice_btn.config(
-                    state="disabled", text="Cockatrice Found"
-                )
-            else:
-                self.cockatrice_status_label.config(
-                    text="⚠ Cockatrice not detected", foreground="orange"
-                )
-                self.get_cockatrice_btn.config(state="normal", text="Get Cockatrice")
-        except Exception as e:
+    def _apply_cockatrice_status(self, is_installed, install_path):
+        """Update the Cockatrice installation widgets (main thread only)."""
+        if is_installed:
+            self.cockatrice_status_label.config(
+                text=f"✓ Cockatrice found: {install_path}", foreground="green"
+            )
+            self.get_cockatrice_btn.config(state="disabled", text="Cockatrice Found")
+        elif is_installed is None:
             self.cockatrice_status_label.config(
                 text="? Unable to check Cockatrice installation", foreground="gray"
             )
             self.get_cockatrice_btn.config(state="normal", text="Get Cockatrice")
+        else:
+            self.cockatrice_status_label.config(
+                text="⚠ Cockatrice not detected", foreground="orange"
+            )
+            self.get_cockatrice_btn.config(state="normal", text="Get Cockatrice")
 
     def open_cockatrice_download(self):
         """Open Cockatrice download page in browser."""
@@ -1112,8 +1148,6 @@ Click below to visit the official Cockatrice website where you can:
         try:
             cache_file = self.mtgjson_scraper.decklist_cache
             if cache_file.exists():
-                from datetime import datetime
-
                 cache_modified = datetime.fromtimestamp(cache_file.stat().st_mtime)
                 age_hours = (datetime.now() - cache_modified).total_seconds() / 3600
 
@@ -1141,9 +1175,9 @@ Click below to visit the official Cockatrice website where you can:
                 # Force fresh check (don't use cache)
                 update_info = check_for_updates(use_cache=False)
                 # Update UI in main thread
-                self.root.after(0, self._handle_update_check_result, update_info)
+                self._post_to_ui(self._handle_update_check_result, update_info)
             except Exception as e:
-                self.root.after(0, self._handle_update_check_error, str(e))
+                self._post_to_ui(self._handle_update_check_error, str(e))
 
         threading.Thread(target=check_in_thread, daemon=True).start()
 
@@ -1200,27 +1234,25 @@ Click below to visit the official Cockatrice website where you can:
             text=f"Update check failed: {error_msg}", foreground="red"
         )
 
-    def check_for_updates_silent(self):
-        """Silently check for updates on startup (using cache)."""
-
-        def check_in_thread():
-            try:
-                # Use cached results for startup check
-                update_info = check_for_updates(use_cache=True)
+    def _silent_update_check_core(self):
+        """Run the cached update check and marshal results to the UI thread."""
+        try:
+            # Use cached results for startup check
+            update_info = check_for_updates(use_cache=True)
 
-                if update_info.get("update_available") and not update_info.get("error"):
-                    # Update available - update UI in main thread
-                    self.root.after(
-                        0, self._handle_silent_update_available, update_info
-                    )
-                else:
-                    # No update or error - just set default status
-                    self.root.after(0, self._handle_silent_no_update, update_info)
-            except Exception:
-                # Ignore errors in silent check
-                pass
+            if update_info.get("update_available") and not update_info.get("error"):
+                # Update available - update UI in main thread
+                self._post_to_ui(self._handle_silent_update_available, update_info)
+            else:
+                # No update or error - just set default status
+                self._post_to_ui(self._handle_silent_no_update, update_info)
+        except Exception:
+            # Ignore errors in silent check
+            pass
 
-        threading.Thread(target=check_in_thread, daemon=True).start()
+    def check_for_updates_silent(self):
+        """Silently check for updates (using cache) in a background thread."""
+        threading.Thread(target=self._silent_update_check_core, daemon=True).start()
 
     def _handle_silent_update_available(self, update_info):
         """Handle silent update check when update is available."""
@@ -1273,17 +1305,13 @@ Click below to visit the official Cockatrice website where you can:
             try:
 
                 def progress_callback(progress, downloaded, total):
-                    # Update status with progress
+                    # Update status with progress. Use the plain-text fastpath
+                    # instead of _set_status_message so the high-frequency
+                    # progress updates don't schedule auto-clear timers.
                     mb_downloaded = downloaded / (1024 * 1024)
                     mb_total = total / (1024 * 1024)
-                    self.root.after(
-                        0,
-                        lambda: self._set_status_message(
-                            f"Downloading: {progress:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)",
-                            "info",
-                            duration=0,  # Don't auto-clear
-                        ),
-                    )
+                    text = f"Downloading: {progress:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)"
+                    self._post_to_ui(self._set_progress_text, text)
 
                 # Download the update
                 update_path = update_manager.download_update(
@@ -1291,15 +1319,14 @@ Click below to visit the official Cockatrice website where you can:
                 )
 
                 if update_path:
-                    self.root.after(0, self._handle_download_success, update_path)
+                    self._post_to_ui(self._handle_download_success, update_path)
                 else:
-                    self.root.after(
-                        0, lambda: self._handle_download_error("Download failed")
+                    self._post_to_ui(lambda: self._handle_download_error("Download failed")
                     )
 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: self._handle_download_error(error_msg))
+                self._post_to_ui(lambda: self._handle_download_error(error_msg))
 
         threading.Thread(target=download_in_thread, daemon=True).start()
 
@@ -1419,6 +1446,11 @@ Click below to visit the official Cockatrice website where you can:
         except Exception:
             return Path.cwd()
 
+    def _on_close(self):
+        """Shut down the worker pool and close the window."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         self.root.mainloop()
 
@@ -1580,8 +1612,6 @@ Click below to visit the official Cockatrice website where you can:
             return
 
         # Create a custom theme object
-        from utils.templates import CockatriceTheme
-
         custom_theme = CockatriceTheme(
             name=name,
             download_url=url,
@@ -1593,9 +1623,7 @@ Click below to visit the official Cockatrice website where you can:
         self._install_theme_async(custom_theme)
 
     def _install_theme_async(self, theme):
-        """Install theme in a background thread."""
-        import threading
-
+        """Install theme on the shared worker pool."""
         themes_folder = self.themes_path.get().strip()
         if not themes_folder:
             self.status_bar.config(text="Please set the Cockatrice themes folder.")
@@ -1609,12 +1637,12 @@ Click below to visit the official Cockatrice website where you can:
             try:
                 installed_path = download_and_install_theme(theme, themes_folder)
                 # Update UI in main thread
-                self.root.after(0, self._theme_install_success, theme, installed_path)
+                self._post_to_ui(self._theme_install_success, theme, installed_path)
             except Exception as e:
                 # Update UI in main thread
-                self.root.after(0, self._theme_install_error, str(e))
+                self._post_to_ui(self._theme_install_error, str(e))
 
-        threading.Thread(target=install_in_thread, daemon=True).start()
+        self._io_pool.submit(install_in_thread)
 
     def _theme_install_success(self, theme, installed_path):
         """Handle successful theme installation."""
@@ -1636,6 +1664,14 @@ Click below to visit the official Cockatrice website where you can:
         self.install_theme_btn.config(state="normal", text="Install Selected Theme")
         self._set_status_message(f"Theme installation failed: {error_msg}", "error")
 
+    def _set_progress_text(self, text):
+        """Fastpath status update for high-frequency progress reporting.
+
+        Skips the color/auto-clear machinery in _set_status_message so
+        repeated calls just update the label text.
+        """
+        self.status_bar.configure(text=text, foreground="blue")
+
     def _set_status_message(self, message, message_type="info", duration=5000):
         """Set status bar message with optional highlighting and auto-clear.
 
@@ -1657,12 +1693,20 @@ Click below to visit the official Cockatrice website where you can:
             text=message, foreground=colors.get(message_type, "black")
         )
 
+        # Cancel any pending auto-clear so rapid updates don't pile up
+        # Tk callbacks that stomp on each other
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+
         # Auto-revert to default after duration
         if duration > 0:
-            self.root.after(
-                duration,
-                lambda: self.status_bar.config(text="Ready", foreground="black"),
-            )
+            self._status_after_id = self.root.after(duration, self._reset_status)
+
+    def _reset_status(self):
+        """Revert the status bar to its default state."""
+        self._status_after_id = None
+        self.status_bar.config(text="Ready", foreground="black")
 
 
 def main():
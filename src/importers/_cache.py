@@ -0,0 +1,88 @@
+"""_cache.py
+
+Small persistent cache for fetched decks, keyed by "site:deck_id".
+
+Stores the parsed deck payload together with the HTTP validators
+(ETag/Last-Modified) so scrapers can issue conditional GETs and reuse the
+cached parse when the server answers 304 Not Modified.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Keep at most this many decks on disk; oldest entries are evicted first
+_MAX_ENTRIES = 128
+
+
+class DeckCache:
+    """On-disk LRU-style cache of parsed decks with their HTTP validators."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / ".cockatrice_assistant_cache" / "decks"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        safe_key = key.replace(":", "_").replace("/", "_")
+        return self.cache_dir / f"{safe_key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached entry.
+
+        Returns:
+            Dict with "etag", "last_modified", "stored_at" and "data"
+            keys, or None if the entry is missing or unreadable.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Touch the file so pruning treats it as recently used
+            path.touch()
+            return entry
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        etag: str = "",
+        last_modified: str = "",
+    ) -> None:
+        """Store a parsed deck payload along with its HTTP validators."""
+        self._prune()
+        try:
+            entry = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored_at": time.time(),
+                "data": data,
+            }
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except (OSError, TypeError) as e:
+            print(f"Failed to cache deck {key}: {e}")
+
+    def _prune(self) -> None:
+        """Evict the least recently used entries once the cache is full."""
+        try:
+            entries = sorted(
+                self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime
+            )
+            excess = len(entries) - _MAX_ENTRIES + 1
+            for path in entries[:max(0, excess)]:
+                path.unlink()
+        except OSError:
+            pass
+
+
+# Shared instance used by the scrapers
+deck_cache = DeckCache()
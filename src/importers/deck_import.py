@@ -5,23 +5,83 @@ Automatically detects the source and applies the appropriate scraping logic.
 """
 
 import re
+import threading
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-import sys
-from pathlib import Path
-
-# Add src directory to path
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
 
 from core.deck_parser import CockatriceDeck, CardEntry
 
 
-@dataclass
+class CardColumns:
+    """Columnar (struct-of-arrays) storage for a list of card entries.
+
+    Parallel lists replace the per-card dicts, so bulk imports hold one
+    compact list per field instead of hundreds of small dicts. Quantities
+    live in a uint16 array since card counts never exceed a few dozen.
+    """
+
+    __slots__ = ("names", "quantities", "sets", "collector_numbers", "scryfall_ids")
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.quantities = array("H")
+        self.sets: List[str] = []
+        self.collector_numbers: List[str] = []
+        self.scryfall_ids: List[str] = []
+
+    @classmethod
+    def from_dicts(cls, cards: List[Dict[str, Any]]) -> "CardColumns":
+        """Build columns from the per-card dicts the scrapers produce."""
+        columns = cls()
+        for card in cards:
+            columns.append(
+                name=card.get("name", ""),
+                quantity=card.get("quantity", 1),
+                set_code=card.get("set", ""),
+                collector_number=card.get("collector_number", ""),
+                scryfall_id=card.get("scryfall_id", ""),
+            )
+        return columns
+
+    def append(
+        self,
+        name: str = "",
+        quantity: int = 1,
+        set_code: str = "",
+        collector_number: str = "",
+        scryfall_id: str = "",
+    ):
+        """Append one card entry across all columns."""
+        self.names.append(name)
+        self.quantities.append(quantity)
+        self.sets.append(set_code)
+        self.collector_numbers.append(collector_number)
+        self.scryfall_ids.append(scryfall_id)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def __iter__(self):
+        """Yield (name, quantity, set, collector_number, scryfall_id) tuples."""
+        return zip(
+            self.names,
+            self.quantities,
+            self.sets,
+            self.collector_numbers,
+            self.scryfall_ids,
+        )
+
+
+@dataclass(slots=True)
 class UniversalDeck:
     """Universal deck representation that can be converted to Cockatrice format."""
 
@@ -30,15 +90,21 @@ class UniversalDeck:
     format: str = ""  # commander, standard, modern, etc.
     description: str = ""
     year: str = ""
-    mainboard: List[Dict[str, Any]] = None
-    sideboard: List[Dict[str, Any]] = None
+    mainboard: CardColumns = None
+    sideboard: CardColumns = None
     commanders: List[str] = None
 
     def __post_init__(self):
+        # Scrapers may hand us list-of-dicts card lists; normalize both
+        # boards to the columnar layout
         if self.mainboard is None:
-            self.mainboard = []
+            self.mainboard = CardColumns()
+        elif isinstance(self.mainboard, list):
+            self.mainboard = CardColumns.from_dicts(self.mainboard)
         if self.sideboard is None:
-            self.sideboard = []
+            self.sideboard = CardColumns()
+        elif isinstance(self.sideboard, list):
+            self.sideboard = CardColumns.from_dicts(self.sideboard)
         if self.commanders is None:
             self.commanders = []
 
@@ -46,6 +112,10 @@ class UniversalDeck:
 class DeckScraper(ABC):
     """Abstract base class for deck scrapers."""
 
+    # Regex fragment matching this scraper's host, used by the manager's
+    # compiled URL router. Scrapers without one fall back to can_handle_url.
+    host_pattern: Optional[str] = None
+
     @abstractmethod
     def can_handle_url(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
@@ -62,6 +132,7 @@ class DeckScraper(ABC):
         pass
 
 
+@lru_cache(maxsize=128)
 def clean_card_name(name: str) -> str:
     """Clean card name for Cockatrice compatibility.
 
@@ -76,11 +147,11 @@ def clean_card_name(name: str) -> str:
     if not name:
         return ""
 
-    # Handle dual-faced cards - take the first name before '//'
-    if "//" in name:
-        return name.split("//")[0].strip()
-
-    return name.strip()
+    # Handle dual-faced cards - take the first name before '//'.
+    # partition scans the string once; split would scan twice and
+    # allocate a throwaway list.
+    head, sep, _ = name.partition("//")
+    return head.strip() if sep else name.strip()
 
 
 def detect_deck_format(deck: UniversalDeck) -> str:
@@ -90,7 +161,7 @@ def detect_deck_format(deck: UniversalDeck) -> str:
         return "commander"
 
     # Check mainboard size for other formats
-    mainboard_count = sum(card.get("quantity", 1) for card in deck.mainboard)
+    mainboard_count = sum(deck.mainboard.quantities)
 
     if mainboard_count == 60:
         return "standard"  # Could also be modern, legacy, etc.
@@ -104,22 +175,21 @@ def detect_deck_format(deck: UniversalDeck) -> str:
 def convert_universal_to_cockatrice(universal_deck: UniversalDeck) -> CockatriceDeck:
     """Convert a UniversalDeck to a CockatriceDeck for .cod export."""
 
-    def make_card_entries(card_list: List[Dict[str, Any]]) -> List[CardEntry]:
-        entries = []
-        for card in card_list:
-            # Clean the card name to handle dual-faced cards
-            raw_name = card.get("name", "")
-            clean_name = clean_card_name(raw_name)
-
-            entry = CardEntry(
-                number=card.get("quantity", 1),
-                name=clean_name,
-                setShortName=card.get("set", ""),
-                collectorNumber=card.get("collector_number", ""),
-                uuid=card.get("scryfall_id", ""),
+    def make_card_entries(columns: CardColumns) -> List[CardEntry]:
+        # Single comprehension over the zipped columns keeps the per-card
+        # cost to one C-level tuple unpack plus the (cached) name cleanup
+        CE = CardEntry
+        clean = clean_card_name
+        return [
+            CE(
+                number=quantity,
+                name=clean(name),
+                setShortName=set_code,
+                collectorNumber=collector_number,
+                uuid=scryfall_id,
             )
-            entries.append(entry)
-        return entries
+            for name, quantity, set_code, collector_number, scryfall_id in columns
+        ]
 
     # Detect format to determine sideboard handling
     deck_format = detect_deck_format(universal_deck)
@@ -132,28 +202,29 @@ def convert_universal_to_cockatrice(universal_deck: UniversalDeck) -> Cockatrice
     # Handle commanders based on format
     if deck_format == "commander" or universal_deck.commanders:
         # For commander decks, put commanders in sideboard
-        for commander in universal_deck.commanders:
-            if commander.strip():
-                commander_name = clean_card_name(commander)
-                entry = CardEntry(
-                    number=1,
-                    name=commander_name,
-                    setShortName="",
-                    collectorNumber="",
-                    uuid="",
-                )
-                side_entries.append(entry)
-
-                # Set the first commander as the banner card
-                if not banner_card:
-                    banner_card = commander_name
+        commander_names = [
+            clean_card_name(commander)
+            for commander in universal_deck.commanders
+            if commander.strip()
+        ]
+        side_entries.extend(
+            CardEntry(
+                number=1,
+                name=commander_name,
+                setShortName="",
+                collectorNumber="",
+                uuid="",
+            )
+            for commander_name in commander_names
+        )
+
+        # The first commander becomes the banner card
+        if commander_names:
+            banner_card = commander_names[0]
     else:
-        # For non-commander decks, set banner card to a random card from mainboard
+        # For non-commander decks, use the first mainboard card as the banner
         if universal_deck.mainboard:
-            import random
-
-            random_card = random.choice(universal_deck.mainboard)
-            banner_card = clean_card_name(random_card.get("name", ""))
+            banner_card = clean_card_name(universal_deck.mainboard.names[0])
 
     cockatrice_deck = CockatriceDeck(
         deckname=universal_deck.name,
@@ -168,23 +239,117 @@ def convert_universal_to_cockatrice(universal_deck: UniversalDeck) -> Cockatrice
 class DeckImportManager:
     """Manager class that coordinates different deck scrapers."""
 
+    # Browsers keep at most ~6 connections per host; stay within that
+    MAX_CONNECTIONS_PER_HOST = 6
+
     def __init__(self):
         self.scrapers: List[DeckScraper] = []
+        self._host_limits = defaultdict(
+            lambda: threading.Semaphore(self.MAX_CONNECTIONS_PER_HOST)
+        )
+        self._router: Optional[re.Pattern] = None
+        self._scrapers_by_group: Dict[str, DeckScraper] = {}
+        # site name -> (host pattern, factory) for scrapers not yet built
+        self._factories: Dict[str, Tuple[str, Any]] = {}
+        self._lazy_by_group: Dict[str, str] = {}
+        # netloc -> scraper memo so repeat dispatches are one dict lookup
+        self._by_host: Dict[str, DeckScraper] = {}
+        # Guards registration and lazy materialization; fetch_decks
+        # dispatches from worker threads that may race on the same factory
+        self._registry_lock = threading.Lock()
 
     def register_scraper(self, scraper: DeckScraper):
         """Register a new deck scraper."""
-        self.scrapers.append(scraper)
+        with self._registry_lock:
+            self.scrapers.append(scraper)
+            self._rebuild_router()
+
+    def register_lazy_scraper(self, site_name: str, host_pattern: str, factory):
+        """Register a scraper without constructing it.
+
+        The factory runs on the first matching URL, so scrapers that are
+        never used in a session never pay their construction cost
+        (sessions, config reads) at startup.
+        """
+        with self._registry_lock:
+            self._factories[site_name] = (host_pattern, factory)
+            self._rebuild_router()
+
+    def _materialize(self, site_name: str) -> DeckScraper:
+        """Construct a lazily registered scraper on first use."""
+        with self._registry_lock:
+            if site_name not in self._factories:
+                # Another thread built this scraper while we waited on
+                # the lock; reuse it instead of popping a gone factory
+                for scraper in self.scrapers:
+                    if scraper.get_site_name() == site_name:
+                        return scraper
+            host_pattern, factory = self._factories.pop(site_name)
+            scraper = factory()
+            self.scrapers.append(scraper)
+            self._rebuild_router()
+            return scraper
+
+    def _rebuild_router(self):
+        """Compile all declared host patterns into one routing regex.
+
+        A single alternation scan replaces the per-scraper substring checks,
+        so routing stays constant-time as scrapers are added.
+        """
+        patterns = []
+        self._scrapers_by_group = {}
+        self._lazy_by_group = {}
+        self._by_host = {}
+        for i, scraper in enumerate(self.scrapers):
+            if scraper.host_pattern:
+                group = f"s{i}"
+                patterns.append(f"(?P<{group}>{scraper.host_pattern})")
+                self._scrapers_by_group[group] = scraper
+        for j, (site_name, (host_pattern, _factory)) in enumerate(
+            self._factories.items()
+        ):
+            group = f"f{j}"
+            patterns.append(f"(?P<{group}>{host_pattern})")
+            self._lazy_by_group[group] = site_name
+
+        self._router = (
+            re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        )
 
     def get_scraper_for_url(self, url: str) -> Optional[DeckScraper]:
         """Find the appropriate scraper for a given URL."""
+        # Hosts resolve to the same scraper every time, so a dict lookup
+        # keyed on netloc skips the router for all but the first URL per host
+        host = urlparse(url).netloc.lower()
+        scraper = self._by_host.get(host)
+        if scraper is not None:
+            return scraper
+
+        if self._router is not None:
+            match = self._router.search(url)
+            if match:
+                group = match.lastgroup
+                if group in self._scrapers_by_group:
+                    scraper = self._scrapers_by_group[group]
+                else:
+                    scraper = self._materialize(self._lazy_by_group[group])
+                if host:
+                    self._by_host[host] = scraper
+                return scraper
+
+        # Fall back to scrapers that don't declare a host pattern
         for scraper in self.scrapers:
-            if scraper.can_handle_url(url):
+            if scraper.host_pattern is None and scraper.can_handle_url(url):
+                if host:
+                    self._by_host[host] = scraper
                 return scraper
         return None
 
     def get_supported_sites(self) -> List[str]:
         """Get list of supported site names."""
-        return [scraper.get_site_name() for scraper in self.scrapers]
+        return [scraper.get_site_name() for scraper in self.scrapers] + list(
+            self._factories
+        )
 
     def fetch_deck(self, url: str) -> Optional[UniversalDeck]:
         """Fetch a deck from any supported URL."""
@@ -194,6 +359,41 @@ class DeckImportManager:
 
         return scraper.fetch_deck(url)
 
+    def _fetch_deck_limited(self, url: str) -> Optional[UniversalDeck]:
+        """Fetch a deck while respecting the per-host connection cap."""
+        with self._host_limits[urlparse(url).netloc]:
+            return self.fetch_deck(url)
+
+    def fetch_decks(
+        self, urls: List[str], max_workers: int = 8
+    ) -> Dict[str, Optional[UniversalDeck]]:
+        """Fetch several decks concurrently.
+
+        The work is network-bound and releases the GIL, so a small thread
+        pool gives near-linear speedup for bulk imports. Concurrency is
+        capped per host to stay polite to the deck sites.
+
+        Args:
+            urls: List of deck URLs to fetch
+            max_workers: Maximum number of worker threads
+
+        Returns:
+            Dict mapping each URL to its UniversalDeck (None for failures)
+        """
+        results: Dict[str, Optional[UniversalDeck]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_deck_limited, url): url for url in urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    print(f"Error fetching deck from {url}: {e}")
+                    results[url] = None
+        return results
+
     def is_supported_url(self, url: str) -> Tuple[bool, str]:
         """Check if URL is supported and return the site name."""
         scraper = self.get_scraper_for_url(url)
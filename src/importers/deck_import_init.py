@@ -1,34 +1,36 @@
 """deck_import_init.py
 
-Initialize and register all deck import scrapers.
+Register all deck import scrapers with the manager.
 """
 
-import sys
-from pathlib import Path
+import logging
 
-# Add src directory to path
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+from .deck_import import deck_import_manager
 
-from importers.deck_import import deck_import_manager
-from importers.moxfield_import import MoxfieldImportScraper
-from importers.mtggoldfish_import import MTGGoldfishImportScraper
+logger = logging.getLogger(__name__)
 
 
 def initialize_deck_importers():
-    """Register all available deck import scrapers."""
-    # Register Moxfield scraper
-    deck_import_manager.register_scraper(MoxfieldImportScraper())
+    """Register factories for all available deck import scrapers.
 
-    # Register MTGGoldfish scraper
-    deck_import_manager.register_scraper(MTGGoldfishImportScraper())
+    Scrapers are constructed lazily on the first matching URL, so this
+    only records name/host/factory triples and stays cheap at startup.
+    """
+    from .moxfield_import import MoxfieldImportScraper
+    from .mtggoldfish_import import MTGGoldfishImportScraper
 
-    print(
-        f"Initialized deck importers for: {', '.join(deck_import_manager.get_supported_sites())}"
+    # Register Moxfield scraper
+    deck_import_manager.register_lazy_scraper(
+        "Moxfield", r"moxfield\.com", MoxfieldImportScraper
     )
 
+    # Register MTGGoldfish scraper
+    deck_import_manager.register_lazy_scraper(
+        "MTGGoldfish", r"mtggoldfish\.com", MTGGoldfishImportScraper
+    )
 
-# Auto-initialize when imported
-initialize_deck_importers()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Registered deck importers for: %s",
+            ", ".join(deck_import_manager.get_supported_sites()),
+        )
@@ -4,29 +4,29 @@ Moxfield scraper adapter for the universal deck import system.
 """
 
 import re
-import sys
-from pathlib import Path
 from typing import Optional
 
-# Add src directory to path
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+from .deck_import import DeckScraper, UniversalDeck
+from .moxfield_scraper import MoxfieldScraper
 
-from importers.deck_import import DeckScraper, UniversalDeck
-from importers.moxfield_scraper import MoxfieldScraper
+# Compiled once: host check and deck-ID extraction share pattern state
+_MOX_HOST_RE = re.compile(r"moxfield\.com", re.IGNORECASE)
+_MOX_ID_RE = re.compile(r"/decks?/([A-Za-z0-9_-]+)")
 
 
 class MoxfieldImportScraper(DeckScraper):
     """Moxfield scraper that implements the universal deck import interface."""
 
-    def __init__(self):
-        self.moxfield_scraper = MoxfieldScraper()
+    host_pattern = r"moxfield\.com"
+
+    def __init__(self, session=None):
+        # A shared session may be passed in so all scrapers reuse one
+        # connection pool; MoxfieldScraper builds a pooled one otherwise
+        self.moxfield_scraper = MoxfieldScraper(session=session)
 
     def can_handle_url(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
-        return "moxfield.com" in url.lower()
+        return _MOX_HOST_RE.search(url) is not None
 
     def get_site_name(self) -> str:
         """Get the display name of this site."""
@@ -35,8 +35,11 @@ class MoxfieldImportScraper(DeckScraper):
     def fetch_deck(self, url: str) -> Optional[UniversalDeck]:
         """Fetch deck data from a Moxfield URL."""
         try:
-            # Extract deck ID from URL
-            deck_id = url.split("/")[-1].split("?")[0]  # Handle query params
+            # Extract deck ID from URL (handles query params and fragments)
+            match = _MOX_ID_RE.search(url)
+            if not match:
+                return None
+            deck_id = match.group(1)
 
             # Fetch deck using existing Moxfield scraper
             moxfield_deck = self.moxfield_scraper.fetch_deck_details(deck_id)
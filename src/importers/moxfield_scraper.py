@@ -5,25 +5,94 @@ Includes smart caching to speed up subsequent loads.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import time
+
+try:
+    # orjson encodes/decodes raw bytes several times faster than stdlib
+    # json; fall back silently when it isn't installed
+    from orjson import loads as _json_loads, dumps as _orjson_dumps, OPT_INDENT_2
+
+    def _json_dump_bytes(obj) -> bytes:
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_bytes(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    # MessagePack is smaller and faster to (de)serialize than JSON and the
+    # cache file is internal, so prefer it when msgspec is installed
+    from msgspec.msgpack import encode as _cache_encode, decode as _cache_decode
+
+    _CACHE_SUFFIX = ".mpk"
+except ImportError:
+    _cache_encode = _json_dump_bytes
+    _cache_decode = _json_loads
+    _CACHE_SUFFIX = ".json"
+try:
+    # httpx can multiplex all deck fetches over one HTTP/2 connection;
+    # requests stays as the fallback transport
+    import httpx
+except ImportError:
+    httpx = None
+import hashlib
 import re
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
-import sys
-from pathlib import Path
-
-# Add src directory to path
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
 
 from core.deck_parser import CockatriceDeck, CardEntry
+from ._cache import deck_cache
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Compiled once; both fetch paths pull a release year out of deck names
+_YEAR_RE = re.compile(r"20\d{2}")
+
+
+def _build_session():
+    """Build the HTTP client for the scraper.
+
+    Prefers an HTTP/2 httpx client, which multiplexes every parallel
+    deck-details request over a single TLS session instead of one TCP
+    connection each. Falls back to a pooled requests.Session with
+    retries when httpx (or its h2 extra) is not installed. Both expose
+    the same .get()/.headers surface the scraper uses.
+    """
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                follow_redirects=True,
+            )
+        except ImportError:
+            pass  # httpx present but the h2 extra is missing
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 @dataclass
@@ -47,16 +116,41 @@ class MoxfieldDeck:
         if self.sideboard is None:
             self.sideboard = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for serialization.
+
+        All fields are already plain types, so direct attribute reads
+        avoid the recursive deepcopy that dataclasses.asdict performs.
+        """
+        return {
+            "name": self.name,
+            "url": self.url,
+            "commanders": self.commanders,
+            "description": self.description,
+            "year": self.year,
+            "format": self.format,
+            "mainboard": self.mainboard,
+            "sideboard": self.sideboard,
+        }
+
 
 class MoxfieldScraper:
     """Scraper to fetch precon deck lists from Moxfield's official WotC account with smart caching."""
 
-    def __init__(self, cache_dir: Optional[str] = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        # Reuse a shared session when provided so all scrapers pool their
+        # connections; otherwise build one so repeated deck fetches skip
+        # the TCP+TLS handshake (HTTP/2 when httpx is available)
+        self.session = session if session is not None else _build_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Accept": "application/json, text/plain, */*",
+                "Accept-Encoding": "gzip, deflate, br",
                 "Content-Type": "application/json",
             }
         )
@@ -70,18 +164,37 @@ class MoxfieldScraper:
             self.cache_dir = Path.home() / ".cockatrice_assistant_cache"
 
         self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "precons_metadata.json"
+        self.cache_file = self.cache_dir / f"precons_metadata{_CACHE_SUFFIX}"
+        # Sidecar integrity tag so a touched or truncated cache file is
+        # detected instead of trusted on mtime alone
+        self.cache_hash_file = self.cache_file.with_suffix(".hash")
         self.cache_max_age_hours = 24  # Refresh cache every 24 hours
 
+    @staticmethod
+    def _cache_digest(payload: bytes) -> str:
+        """Fast content hash for cache integrity checks."""
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     def _is_cache_valid(self) -> bool:
         """Check if the cached data is still valid (not expired)."""
         if not self.cache_file.exists():
             return False
 
         try:
-            cache_modified = datetime.fromtimestamp(self.cache_file.stat().st_mtime)
-            age_limit = datetime.now() - timedelta(hours=self.cache_max_age_hours)
-            return cache_modified > age_limit
+            # Plain epoch-seconds compare; building datetime objects for
+            # this also invites DST/timezone surprises
+            age = time.time() - self.cache_file.stat().st_mtime
+            if age >= self.cache_max_age_hours * 3600:
+                return False
+
+            # mtime is only a hint; verify the content hash so a touched
+            # or half-written file doesn't pass as fresh
+            if self.cache_hash_file.exists():
+                expected = self.cache_hash_file.read_text().strip()
+                return self._cache_digest(self.cache_file.read_bytes()) == expected
+
+            # Pre-hash cache files get a pass; the next save writes the tag
+            return True
         except (OSError, ValueError):
             return False
 
@@ -91,8 +204,7 @@ class MoxfieldScraper:
             return None
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            cache_data = _cache_decode(self.cache_file.read_bytes())
 
             # Convert dict data back to MoxfieldDeck objects
             decks = []
@@ -105,170 +217,328 @@ class MoxfieldScraper:
             )
             return decks
 
-        except (json.JSONDecodeError, KeyError, TypeError, FileNotFoundError) as e:
+        except (ValueError, KeyError, TypeError, OSError) as e:
             print(f"Cache file corrupted, will refresh: {e}")
             return None
 
-    def _save_cache(self, decks: List[MoxfieldDeck]) -> None:
+    def _read_cached_pages(self) -> Dict[str, Any]:
+        """Load per-page cache entries with their HTTP validators.
+
+        Ignores the TTL on purpose: even an expired cache still holds
+        ETags that let the refresh come back as cheap 304s.
+        """
+        try:
+            cache_data = _cache_decode(self.cache_file.read_bytes())
+            return cache_data.get("pages") or {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _save_cache(
+        self, decks: List[MoxfieldDeck], pages: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Save precon metadata to cache file."""
         try:
             cache_data = {
                 "cached_at": datetime.now().isoformat(),
                 "cache_version": "1.0",
                 "total_decks": len(decks),
-                "decks": [asdict(deck) for deck in decks],
+                "decks": [deck.to_dict() for deck in decks],
+                "pages": pages or {},
             }
 
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            payload = _cache_encode(cache_data)
+            self.cache_file.write_bytes(payload)
+            self.cache_hash_file.write_text(self._cache_digest(payload))
 
             print(f"Cached {len(decks)} precons to {self.cache_file}")
 
         except (OSError, TypeError) as e:
             print(f"Failed to save cache: {e}")
 
-    def fetch_all_precons(self, force_refresh: bool = False) -> List[MoxfieldDeck]:
-        """Fetch all commander precon decks from Moxfield's WotC account with caching.
+    def _fetch_precon_page(
+        self, page: int, page_size: int, cached_page: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Fetch one page of the WotC account's deck list.
+
+        Issues a conditional GET when a cached entry with validators is
+        available; a 304 reuses the cached parse without re-downloading.
+        Returns a page entry dict holding the parsed precons plus the
+        validators and paging info needed for the next refresh.
+        """
+        params = {
+            "pageNumber": page,
+            "pageSize": page_size,
+            "sortType": "updated",
+            "sortDirection": "Descending",
+            # Ask the API to pre-filter to precons so non-precon decks never
+            # hit the wire; the client-side format check stays as a safety
+            # net in case the parameter is ignored
+            "fmt": "commanderPrecons",
+        }
+        headers = {}
+        if cached_page:
+            if cached_page.get("etag"):
+                headers["If-None-Match"] = cached_page["etag"]
+            if cached_page.get("last_modified"):
+                headers["If-Modified-Since"] = cached_page["last_modified"]
+
+        response = self.session.get(
+            self.base_url, params=params, headers=headers, timeout=30
+        )
+
+        if response.status_code == 304 and cached_page:
+            print(f"Page {page} unchanged, reusing cached copy")
+            return cached_page
+
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        decks_on_page = data.get("data") or []
+        return {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "total_pages": int(data.get("totalPages") or 0),
+            "count": len(decks_on_page),
+            "decks": [
+                deck.to_dict() for deck in self._parse_precon_page(decks_on_page, page)
+            ],
+        }
+
+    def _parse_precon_page(
+        self, decks_on_page: List[Dict[str, Any]], page: int
+    ) -> List[MoxfieldDeck]:
+        """Filter one page of deck data down to Commander Precons."""
+        # Filter for Commander Precons on this page
+        precons_on_page = []
+        for deck_data in decks_on_page:
+            format_name = deck_data.get("format", "").lower()
+            if "commanderprecon" in format_name:
+                precons_on_page.append(deck_data)
+
+        print(
+            f"Found {len(precons_on_page)} Commander Precons on page {page} (out of {len(decks_on_page)} total decks)"
+        )
+
+        decks = []
+        for deck_data in precons_on_page:
+            try:
+                deck_name = deck_data.get("name", "")
+
+                # Skip collector's edition decks if requested
+                if any(term in deck_name.lower() for term in ["collector's edition"]):
+                    print(f"  Skipping collector's edition: {deck_name}")
+                    continue
+
+                # Extract basic info
+                deck_url = f"https://moxfield.com/decks/{deck_data.get('publicId', '')}"
+                format_name = deck_data.get("format", "")
+
+                # Try to extract year from name
+                year_match = _YEAR_RE.search(deck_name)
+                year = year_match.group() if year_match else ""
+
+                # Extract commander from deck data
+                commanders = []
+                if "commanders" in deck_data and deck_data["commanders"]:
+                    for commander_data in deck_data["commanders"]:
+                        commander_name = commander_data.get("card", {}).get("name", "")
+                        if commander_name:
+                            commanders.append(commander_name)
+
+                deck = MoxfieldDeck(
+                    name=deck_name,
+                    url=deck_url,
+                    commanders=commanders,
+                    description=deck_data.get("description", ""),
+                    year=year,
+                    format=format_name,
+                    mainboard=[],  # Will be populated when fetching details
+                    sideboard=[],  # Will be populated when fetching details
+                )
+
+                decks.append(deck)
+
+            except Exception as e:
+                print(f"Error parsing deck: {e}")
+                continue
+
+        return decks
+
+    def iter_all_precons(self, force_refresh: bool = False):
+        """Yield commander precon decks as their pages arrive.
+
+        Streaming callers (e.g. a UI list filling in) see the first page
+        immediately instead of waiting for the whole catalog; memory peak
+        is one page rather than every deck at once. A completed walk
+        refreshes the on-disk cache as a side effect.
 
         Args:
             force_refresh: If True, bypass cache and fetch fresh data
+
+        Yields:
+            MoxfieldDeck entries in page order
         """
         # Try to load from cache first (unless forced refresh)
         if not force_refresh:
             cached_decks = self._load_cache()
             if cached_decks is not None:
-                return cached_decks
+                yield from cached_decks
+                return
 
-        # Cache miss or forced refresh - fetch from API
+        yielded = False
         try:
             print("Fetching precons from Moxfield WotC account...")
 
-            all_decks = []
-            page = 1
             page_size = 100
+            # Even an expired cache contributes ETags, so unchanged pages
+            # come back as 304s instead of full payloads
+            cached_pages = self._read_cached_pages()
+
+            # Fetch page 1 synchronously to learn the total page count
+            first = self._fetch_precon_page(1, page_size, cached_pages.get("1"))
+            pages: Dict[str, Any] = {"1": first}
+            total_pages = first.get("total_pages", 0)
+            for deck_data in first["decks"]:
+                yielded = True
+                yield MoxfieldDeck(**deck_data)
+
+            if total_pages > 1:
+                # The remaining pages are independent network waits, so
+                # fetch them concurrently; the small pool doubles as the
+                # politeness cap the old per-page sleep provided
+                with ThreadPoolExecutor(max_workers=6) as pool:
+                    fetched = pool.map(
+                        lambda p: self._fetch_precon_page(
+                            p, page_size, cached_pages.get(str(p))
+                        ),
+                        range(2, total_pages + 1),
+                    )
+                    for page, entry in enumerate(fetched, start=2):
+                        pages[str(page)] = entry
+                        for deck_data in entry["decks"]:
+                            yielded = True
+                            yield MoxfieldDeck(**deck_data)
+            else:
+                # No page count in the response; walk pages serially until
+                # one comes back short
+                page = 1
+                entry = first
+                while entry.get("count", 0) == page_size:
+                    page += 1
+                    entry = self._fetch_precon_page(
+                        page, page_size, cached_pages.get(str(page))
+                    )
+                    pages[str(page)] = entry
+                    for deck_data in entry["decks"]:
+                        yielded = True
+                        yield MoxfieldDeck(**deck_data)
 
-            while True:
-                print(f"Fetching page {page}...")
-
-                # Get all decks from this page, then filter for Commander Precons
-                params = {
-                    "pageNumber": page,
-                    "pageSize": page_size,
-                    "sortType": "updated",
-                    "sortDirection": "Descending",
-                }
-
-                response = self.session.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
-
-                data = response.json()
-
-                if not data.get("data") or len(data["data"]) == 0:
-                    print(f"No more decks found on page {page}")
-                    break
-
-                decks_on_page = data["data"]
+        except Exception as e:
+            print(f"Error fetching precons from Moxfield: {e}")
+            # Fall back to cached data only if nothing was streamed yet
+            if not yielded:
+                cached_decks = self._load_cache()
+                if cached_decks is not None:
+                    print("Returning cached data as fallback due to API error")
+                    yield from cached_decks
+            return
+
+        total = sum(len(entry["decks"]) for entry in pages.values())
+        print(
+            f"Successfully found {total} Commander Precons from Moxfield WotC account"
+        )
 
-                # Filter for Commander Precons on this page
-                precons_on_page = []
-                for deck_data in decks_on_page:
-                    format_name = deck_data.get("format", "").lower()
-                    if "commanderprecon" in format_name:
-                        precons_on_page.append(deck_data)
+        # Save the completed walk to cache for future use
+        all_decks = [
+            MoxfieldDeck(**deck_data)
+            for key in sorted(pages, key=int)
+            for deck_data in pages[key]["decks"]
+        ]
+        self._save_cache(all_decks, pages)
 
-                print(
-                    f"Found {len(precons_on_page)} Commander Precons on page {page} (out of {len(decks_on_page)} total decks)"
-                )
+    def fetch_all_precons(self, force_refresh: bool = False) -> List[MoxfieldDeck]:
+        """Fetch all commander precon decks from Moxfield's WotC account with caching.
 
-                for deck_data in precons_on_page:
-                    try:
-                        deck_name = deck_data.get("name", "")
-
-                        # Skip collector's edition decks if requested
-                        if any(
-                            term in deck_name.lower()
-                            for term in ["collector's edition"]
-                        ):
-                            print(f"  Skipping collector's edition: {deck_name}")
-                            continue
-
-                        # Extract basic info
-                        deck_url = f"https://moxfield.com/decks/{deck_data.get('publicId', '')}"
-                        format_name = deck_data.get("format", "")
-
-                        # Try to extract year from name
-                        year_match = re.search(r"20\d{2}", deck_name)
-                        year = year_match.group() if year_match else ""
-
-                        # Extract commander from deck data
-                        commanders = []
-                        if "commanders" in deck_data and deck_data["commanders"]:
-                            for commander_data in deck_data["commanders"]:
-                                commander_name = commander_data.get("card", {}).get(
-                                    "name", ""
-                                )
-                                if commander_name:
-                                    commanders.append(commander_name)
-
-                        deck = MoxfieldDeck(
-                            name=deck_name,
-                            url=deck_url,
-                            commanders=commanders,
-                            description=deck_data.get("description", ""),
-                            year=year,
-                            format=format_name,
-                            mainboard=[],  # Will be populated when fetching details
-                            sideboard=[],  # Will be populated when fetching details
-                        )
-
-                        all_decks.append(deck)
-
-                    except Exception as e:
-                        print(f"Error parsing deck: {e}")
-                        continue
-
-                # Check if we should continue to next page
-                if len(decks_on_page) < page_size:
-                    print(
-                        f"Reached end of results (got {len(decks_on_page)} < {page_size})"
-                    )
-                    break
+        List-returning wrapper around iter_all_precons for callers that
+        need the whole catalog at once.
 
-                page += 1
-                time.sleep(0.5)  # Be respectful to the API
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh data
+        """
+        return list(self.iter_all_precons(force_refresh))
 
-            print(
-                f"Successfully found {len(all_decks)} Commander Precons from Moxfield WotC account"
-            )
+    def fetch_many_deck_details(
+        self, deck_ids: List[str], max_workers: int = 8
+    ) -> Dict[str, Optional[MoxfieldDeck]]:
+        """Fetch details for several decks concurrently.
 
-            # Save to cache for future use
-            self._save_cache(all_decks)
+        Each fetch is a blocking HTTPS round trip, so a bounded thread
+        pool over the shared session turns a serial crawl into a handful
+        of parallel waits.
 
-            return all_decks
+        Args:
+            deck_ids: Moxfield public deck IDs to fetch
+            max_workers: Maximum number of worker threads
 
-        except Exception as e:
-            print(f"Error fetching precons from Moxfield: {e}")
-            # Try to return cached data as fallback if available
-            cached_decks = self._load_cache()
-            if cached_decks is not None:
-                print("Returning cached data as fallback due to API error")
-                return cached_decks
-            return []
+        Returns:
+            Dict mapping each deck ID to its MoxfieldDeck (None for failures)
+        """
+        results: Dict[str, Optional[MoxfieldDeck]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.fetch_deck_details, deck_id): deck_id
+                for deck_id in deck_ids
+            }
+            for future in as_completed(futures):
+                deck_id = futures[future]
+                try:
+                    results[deck_id] = future.result()
+                except Exception as e:
+                    print(f"Error fetching deck details for {deck_id}: {e}")
+                    results[deck_id] = None
+        return results
+
+    # Published precons are effectively immutable, so a cached deck this
+    # recent is served without touching the network at all
+    DETAILS_FRESH_SECONDS = 7 * 24 * 3600
 
     def fetch_deck_details(self, deck_id: str) -> MoxfieldDeck | None:
         """Fetch detailed card list from a specific Moxfield deck ID."""
+        cached = None
         try:
             if not deck_id:
                 return None
 
+            cache_key = f"moxfield:{deck_id}"
+            cached = deck_cache.get(cache_key)
+
+            # Fresh enough: skip HTTP entirely
+            if cached and (
+                time.time() - cached.get("stored_at", 0) < self.DETAILS_FRESH_SECONDS
+            ):
+                return MoxfieldDeck(**cached["data"])
+
             print(f"Fetching deck details for: {deck_id}")
 
+            # Issue a conditional GET so unchanged decks come back as a
+            # cheap 304 and we reuse the cached parse
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
             # Use Moxfield API to get deck details
             api_url = f"https://api2.moxfield.com/v2/decks/all/{deck_id}"
-            response = self.session.get(api_url, timeout=30)
+            response = self.session.get(api_url, headers=headers, timeout=30)
+
+            if response.status_code == 304 and cached:
+                print(f"Deck {deck_id} unchanged, using cached copy")
+                return MoxfieldDeck(**cached["data"])
+
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             # Extract basic info
             name = data.get("name", "Unknown Deck")
@@ -276,7 +546,7 @@ class MoxfieldScraper:
             format_name = data.get("format", "")
 
             # Extract year from name
-            year_match = re.search(r"20\d{2}", name)
+            year_match = _YEAR_RE.search(name)
             year = year_match.group() if year_match else ""
 
             # Extract commanders
@@ -301,7 +571,7 @@ class MoxfieldScraper:
                                     {
                                         "quantity": card_info.get("quantity", 1),
                                         "name": card_data.get("name", ""),
-                                        "set": card_data.get("set", ""),
+                                        "set": sys.intern(card_data.get("set", "")),
                                         "collector_number": card_data.get("cn", ""),
                                         "scryfall_id": card_data.get("scryfall_id", ""),
                                     }
@@ -320,13 +590,13 @@ class MoxfieldScraper:
                                     {
                                         "quantity": card_info.get("quantity", 1),
                                         "name": card_data.get("name", ""),
-                                        "set": card_data.get("set", ""),
+                                        "set": sys.intern(card_data.get("set", "")),
                                         "collector_number": card_data.get("cn", ""),
                                         "scryfall_id": card_data.get("scryfall_id", ""),
                                     }
                                 )
 
-            return MoxfieldDeck(
+            deck = MoxfieldDeck(
                 name=name,
                 url=f"https://moxfield.com/decks/{deck_id}",
                 commanders=commanders,
@@ -337,8 +607,23 @@ class MoxfieldScraper:
                 description=description,
             )
 
+            # Store the parsed deck with its validators for future
+            # conditional requests
+            deck_cache.set(
+                cache_key,
+                deck.to_dict(),
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+            )
+
+            return deck
+
         except Exception as e:
             print(f"Error fetching deck details: {e}")
+            # A stale cached copy beats no deck at all
+            if cached:
+                print(f"Returning cached copy of {deck_id} after fetch error")
+                return MoxfieldDeck(**cached["data"])
             return None
 
 
@@ -357,281 +642,344 @@ def clean_card_name(name: str) -> str:
         return ""
 
     # Handle dual-faced cards - take the first name before '//'
-    if "//" in name:
-        return name.split("//")[0].strip()
+    return name.split("//", 1)[0].strip()
+
+
+# Indicator tables for the banner-card creature heuristic, hoisted to
+# module scope and compiled into single alternations so one linear scan
+# replaces ~130 Python-level substring checks per card
+_NON_CREATURE_INDICATORS = (
+    # Spells and effects
+    "lightning bolt",
+    "counterspell",
+    "dispel",
+    "cancel",
+    "negate",
+    "shock",
+    "path to exile",
+    "swords to plowshares",
+    "wrath",
+    "damnation",
+    "brainstorm",
+    "force of will",
+    "dark ritual",
+    "bolt",
+    # Planeswalkers (usually have comma in name)
+    "jace,",
+    "elspeth,",
+    "chandra,",
+    "garruk,",
+    "liliana,",
+    "ajani,",
+    "nissa,",
+    "gideon,",
+    "vraska,",
+    "teferi,",
+    "karn,",
+    "ugin,",
+    # Artifacts and enchantments
+    "sol ring",
+    "mana",
+    "signet",
+    "talisman",
+    "medallion",
+    "crypt",
+    "vault",
+    "temple",
+    "sanctum",
+    "citadel",
+    "tower",
+    "spire",
+    # Lands
+    "plains",
+    "island",
+    "swamp",
+    "mountain",
+    "forest",
+    "wastes",
+    "command tower",
+    "reliquary tower",
+    "terramorphic expanse",
+    # Common spell words
+    "burn",
+    "draw",
+    "tutor",
+    "search",
+    "fetch",
+    "ramp",
+    "removal",
+    "exile",
+    "destroy",
+    "sacrifice",
+    "board wipe",
+    "instant",
+    "sorcery",
+)
+
+_CREATURE_INDICATORS = (
+    # Creature types
+    "warrior",
+    "soldier",
+    "knight",
+    "wizard",
+    "shaman",
+    "druid",
+    "priest",
+    "vampire",
+    "zombie",
+    "spirit",
+    "angel",
+    "demon",
+    "dragon",
+    "beast",
+    "goblin",
+    "orc",
+    "elf",
+    "dwarf",
+    "human",
+    "giant",
+    "troll",
+    "ogre",
+    "elemental",
+    "construct",
+    "golem",
+    "spider",
+    "wolf",
+    "bear",
+    "cat",
+    "dog",
+    "bird",
+    "snake",
+    "lizard",
+    "fish",
+    "whale",
+    "kraken",
+    "horror",
+    "nightmare",
+    "shade",
+    "wraith",
+    "skeleton",
+    "rat",
+    "insect",
+    "bat",
+    "avatar",
+    "incarnation",
+    "titan",
+    "hydra",
+    "wurm",
+    "minotaur",
+    "sphinx",
+    "phoenix",
+    "griffin",
+    "pegasus",
+    "unicorn",
+    "centaur",
+    "satyr",
+    "faerie",
+    # Common creature name patterns and titles
+    " lord",
+    " master",
+    " champion",
+    " guardian",
+    " keeper",
+    " warden",
+    " sentinel",
+    " protector",
+    " hunter",
+    " seeker",
+    " caller",
+    " summoner",
+    " wielder",
+    " bearer",
+    " rider",
+    " walker",
+    " guide",
+    " scout",
+    # Descriptive creature words
+    "king ",
+    "queen ",
+    "prince ",
+    "princess ",
+    "emperor ",
+    "empress ",
+    "general ",
+    "captain ",
+    "archon",
+    "elder ",
+    "ancient ",
+    "primarch",
+    "khan ",
+    "baron",
+    "young ",
+    "veteran",
+    "seasoned",
+    "mighty",
+    "fierce",
+    "savage",
+    "noble",
+    "bloodthirsty",
+    "ferocious",
+    "mage",
+    "adept",
+    # Creature name endings that are common
+    "mancer",
+    "bringer",
+    "caller",
+    "seeker",
+    "slayer",
+    "ranger",
+)
+
+_NON_CREATURE_RE = re.compile("|".join(map(re.escape, _NON_CREATURE_INDICATORS)))
+_CREATURE_RE = re.compile("|".join(map(re.escape, _CREATURE_INDICATORS)))
+
+# Planeswalker name titles that pair with a comma in the card name
+_PLANESWALKER_TITLES = (
+    "the mind sculptor",
+    "knight-errant",
+    "guildpact",
+    "worldwaker",
+    "voice of zendikar",
+    "chainer of the dead",
+    "unraveler of secrets",
+)
+
+# Special cases for known creature names that don't follow patterns
+_KNOWN_CREATURES = frozenset(
+    {
+        "tarmogoyf",
+        "snapcaster mage",
+        "lightning dragon",
+        "primeval titan",
+        "serra angel",
+        "llanowar elves",
+        "vampire nighthawk",
+        "goblin guide",
+        "young pyromancer",
+    }
+)
+
+
+@lru_cache(maxsize=8192)
+def is_likely_creature(card_name: str) -> bool:
+    """Determine if a card is likely to be a creature based on its name."""
+    if not card_name:
+        return False
 
-    return name.strip()
+    card_lower = card_name.lower()
 
+    # Check for specific non-creature cards first
+    if _NON_CREATURE_RE.search(card_lower):
+        return False
 
-def convert_moxfield_to_cockatrice(moxfield_deck: MoxfieldDeck) -> CockatriceDeck:
-    """Convert a MoxfieldDeck to a CockatriceDeck for .cod export."""
+    # Planeswalker detection (they have comma and titles)
+    if "," in card_name and any(
+        title in card_lower for title in _PLANESWALKER_TITLES
+    ):
+        return False
 
-    def make_card_entries(card_list: List[Dict[str, Any]]) -> List[CardEntry]:
-        entries = []
-        for card in card_list:
-            # Clean the card name to handle dual-faced cards
-            raw_name = card.get("name", "")
-            clean_name = clean_card_name(raw_name)
-
-            entry = CardEntry(
-                number=card.get("quantity", 1),
-                name=clean_name,
-                setShortName=card.get("set", ""),
-                collectorNumber=card.get("collector_number", ""),
-                uuid=card.get("scryfall_id", ""),
-            )
-            entries.append(entry)
-        return entries
+    # Check for creature indicators
+    if _CREATURE_RE.search(card_lower):
+        return True
 
-    def is_likely_creature(card_name: str) -> bool:
-        """Determine if a card is likely to be a creature based on its name."""
-        if not card_name:
-            return False
+    if card_lower in _KNOWN_CREATURES:
+        return True
 
-        card_lower = card_name.lower()
-
-        # Cards that are definitely not creatures (check first for higher confidence)
-        non_creature_indicators = [
-            # Spells and effects
-            "lightning bolt",
-            "counterspell",
-            "dispel",
-            "cancel",
-            "negate",
-            "shock",
-            "path to exile",
-            "swords to plowshares",
-            "wrath",
-            "damnation",
-            "brainstorm",
-            "force of will",
-            "dark ritual",
-            "bolt",
-            # Planeswalkers (usually have comma in name)
-            "jace,",
-            "elspeth,",
-            "chandra,",
-            "garruk,",
-            "liliana,",
-            "ajani,",
-            "nissa,",
-            "gideon,",
-            "vraska,",
-            "teferi,",
-            "karn,",
-            "ugin,",
-            # Artifacts and enchantments
-            "sol ring",
-            "mana",
-            "signet",
-            "talisman",
-            "medallion",
-            "crypt",
-            "vault",
-            "temple",
-            "sanctum",
-            "citadel",
-            "tower",
-            "spire",
-            # Lands
-            "plains",
-            "island",
-            "swamp",
-            "mountain",
-            "forest",
-            "wastes",
-            "command tower",
-            "reliquary tower",
-            "terramorphic expanse",
-            # Common spell words
-            "burn",
-            "draw",
-            "tutor",
-            "search",
-            "fetch",
-            "ramp",
-            "removal",
-            "exile",
-            "destroy",
-            "sacrifice",
-            "board wipe",
-            "instant",
-            "sorcery",
-        ]
+    # Check for specific creature name patterns that might be missed
+    if "dragon" in card_lower and "lightning" in card_lower:
+        return True
 
-        # Check for specific non-creature cards first
-        for indicator in non_creature_indicators:
-            if indicator in card_lower:
-                return False
+    # Additional heuristics for creature-like names
+    words = card_name.split()
+    if len(words) >= 2:
+        # Creatures often have proper noun patterns (capitalized words)
+        capitalized_count = sum(1 for word in words if word and word[0].isupper())
 
-        # Planeswalker detection (they have comma and titles)
-        if "," in card_name and any(
-            title in card_lower
-            for title in [
-                "the mind sculptor",
-                "knight-errant",
-                "guildpact",
-                "worldwaker",
-                "voice of zendikar",
-                "chainer of the dead",
-                "unraveler of secrets",
-            ]
-        ):
-            return False
+        # If most words are capitalized and it's not a known non-creature type, likely a creature
+        if capitalized_count >= 2 and len(words) <= 4:
+            # Additional check: avoid planeswalker-like patterns
+            if not ("," in card_name and len(words) > 3):
+                return True
 
-        # Common creature type words that appear in creature names
-        creature_indicators = [
-            # Creature types
-            "warrior",
-            "soldier",
-            "knight",
-            "wizard",
-            "shaman",
-            "druid",
-            "priest",
-            "vampire",
-            "zombie",
-            "spirit",
-            "angel",
-            "demon",
-            "dragon",
-            "beast",
-            "goblin",
-            "orc",
-            "elf",
-            "dwarf",
-            "human",
-            "giant",
-            "troll",
-            "ogre",
-            "elemental",
-            "construct",
-            "golem",
-            "spider",
-            "wolf",
-            "bear",
-            "cat",
-            "dog",
-            "bird",
-            "snake",
-            "lizard",
-            "fish",
-            "whale",
-            "kraken",
-            "horror",
-            "nightmare",
-            "shade",
-            "wraith",
-            "skeleton",
-            "rat",
-            "insect",
-            "bat",
-            "avatar",
-            "incarnation",
-            "titan",
-            "hydra",
-            "wurm",
-            "minotaur",
-            "sphinx",
-            "phoenix",
-            "griffin",
-            "pegasus",
-            "unicorn",
-            "centaur",
-            "satyr",
-            "faerie",
-            # Common creature name patterns and titles
-            " lord",
-            " master",
-            " champion",
-            " guardian",
-            " keeper",
-            " warden",
-            " sentinel",
-            " protector",
-            " hunter",
-            " seeker",
-            " caller",
-            " summoner",
-            " wielder",
-            " bearer",
-            " rider",
-            " walker",
-            " guide",
-            " scout",
-            # Descriptive creature words
-            "king ",
-            "queen ",
-            "prince ",
-            "princess ",
-            "emperor ",
-            "empress ",
-            "general ",
-            "captain ",
-            "archon",
-            "elder ",
-            "ancient ",
-            "primarch",
-            "khan ",
-            "baron",
-            "young ",
-            "veteran",
-            "seasoned",
-            "mighty",
-            "fierce",
-            "savage",
-            "noble",
-            "bloodthirsty",
-            "ferocious",
-            "mage",
-            "adept",
-            # Creature name endings that are common
-            "mancer",
-            "bringer",
-            "caller",
-            "seeker",
-            "slayer",
-            "ranger",
-        ]
+    return False
 
-        # Check for creature indicators
-        for indicator in creature_indicators:
-            if indicator in card_lower:
-                return True
+def classify_creatures_batch(names: List[str]) -> List[bool]:
+    """Classify many card names with one scan per indicator table.
 
-        # Special cases for known creature names that don't follow patterns
-        known_creatures = [
-            "tarmogoyf",
-            "snapcaster mage",
-            "lightning dragon",
-            "primeval titan",
-            "serra angel",
-            "llanowar elves",
-            "vampire nighthawk",
-            "goblin guide",
-            "young pyromancer",
-        ]
+    Joining the names lets the two alternation regexes and the single
+    str.lower() run once per deck instead of once per card; matches are
+    bucketed back to their card by offset.
+    """
+    if not names:
+        return []
+
+    blob = "\n".join(names).lower()
+    starts = [0]
+    for name in names[:-1]:
+        starts.append(starts[-1] + len(name) + 1)
+
+    def bucket_hits(pattern: re.Pattern) -> List[bool]:
+        hits = [False] * len(names)
+        for match in pattern.finditer(blob):
+            index = bisect_right(starts, match.start()) - 1
+            # Ignore matches that would straddle the delimiter
+            if match.end() <= starts[index] + len(names[index]):
+                hits[index] = True
+        return hits
+
+    non_creature_hits = bucket_hits(_NON_CREATURE_RE)
+    creature_hits = bucket_hits(_CREATURE_RE)
+
+    results = []
+    for index, name in enumerate(names):
+        if not name or non_creature_hits[index]:
+            results.append(False)
+            continue
+
+        card_lower = blob[starts[index] : starts[index] + len(name)]
 
-        if card_lower in known_creatures:
-            return True
+        # Planeswalker detection (they have comma and titles)
+        if "," in name and any(
+            title in card_lower for title in _PLANESWALKER_TITLES
+        ):
+            results.append(False)
+            continue
 
-        # Check for specific creature name patterns that might be missed
-        if "dragon" in card_lower and "lightning" in card_lower:
-            return True
+        if creature_hits[index] or card_lower in _KNOWN_CREATURES:
+            results.append(True)
+            continue
 
-        # Additional heuristics for creature-like names
-        words = card_name.split()
+        # Same capitalization fallback as is_likely_creature
+        words = name.split()
         if len(words) >= 2:
-            # Creatures often have proper noun patterns (capitalized words)
             capitalized_count = sum(1 for word in words if word and word[0].isupper())
-
-            # If most words are capitalized and it's not a known non-creature type, likely a creature
             if capitalized_count >= 2 and len(words) <= 4:
-                # Additional check: avoid planeswalker-like patterns
-                if not ("," in card_name and len(words) > 3):
-                    return True
+                if not ("," in name and len(words) > 3):
+                    results.append(True)
+                    continue
+
+        results.append(False)
+    return results
+
+
+def _make_card_entries(card_list: List[Dict[str, Any]]) -> List[CardEntry]:
+    # One comprehension keeps the whole conversion in comprehension
+    # bytecode with a single right-sized list allocation; the name
+    # cleanup still handles dual-faced cards
+    return [
+        CardEntry(
+            number=card.get("quantity", 1),
+            name=clean_card_name(card.get("name", "")),
+            setShortName=card.get("set", ""),
+            collectorNumber=card.get("collector_number", ""),
+            uuid=card.get("scryfall_id", ""),
+        )
+        for card in card_list
+    ]
 
-        return False
+
+def convert_moxfield_to_cockatrice(moxfield_deck: MoxfieldDeck) -> CockatriceDeck:
+    """Convert a MoxfieldDeck to a CockatriceDeck for .cod export."""
 
     # Determine deck type and handle banner card accordingly
     is_commander_deck = (
@@ -661,7 +1009,7 @@ def convert_moxfield_to_cockatrice(moxfield_deck: MoxfieldDeck) -> CockatriceDec
 
         cockatrice_deck = CockatriceDeck(
             deckname=moxfield_deck.name,
-            zone_main=make_card_entries(moxfield_deck.mainboard),
+            zone_main=_make_card_entries(moxfield_deck.mainboard),
             zone_side=commander_entries,  # Commanders go in sideboard
             banner_card=banner_card,  # Set banner card to first commander
         )
@@ -676,8 +1024,8 @@ def convert_moxfield_to_cockatrice(moxfield_deck: MoxfieldDeck) -> CockatriceDec
 
         cockatrice_deck = CockatriceDeck(
             deckname=moxfield_deck.name,
-            zone_main=make_card_entries(moxfield_deck.mainboard),
-            zone_side=make_card_entries(moxfield_deck.sideboard),
+            zone_main=_make_card_entries(moxfield_deck.mainboard),
+            zone_side=_make_card_entries(moxfield_deck.sideboard),
             banner_card=banner_card,  # Set banner card to first creature or first card
         )
 
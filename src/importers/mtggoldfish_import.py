@@ -4,42 +4,164 @@ MTGGoldfish scraper for the universal deck import system.
 Supports both archetype pages and individual deck pages.
 """
 
+import html as html_module
 import re
+from functools import lru_cache
 import requests
-import sys
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 from typing import Optional, List, Dict, Any
 
-# Add src directory to path
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+from .deck_import import DeckScraper, UniversalDeck
+
+# One session shared by every scraper instance: batch imports construct a
+# scraper per URL, and a module-level session keeps the TLS connection to
+# mtggoldfish.com alive across all of them instead of re-handshaking
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Cache-Control": "max-age=0",
+    }
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Deck links look like /deck/7432842; compiled once and also used as the
+# href filter so BeautifulSoup only materializes matching anchors
+_DECK_HREF_RE = re.compile(r"/deck/(\d+)$")
+
+# Every pattern the parsers use, compiled once. The hot extraction paths
+# run these per line of page text, so calling methods on the compiled
+# objects skips the re-module cache lookup on each hit.
+_PAREN_SUFFIX_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_BRACKET_SUFFIX_RE = re.compile(r"\s*\[[^\]]*\]\s*$")
+_CARD_LINE_RE = re.compile(r"(\d+)x?\s+(.+)")
+_QTY_LINE_RE = re.compile(r"(\d+)\s+(.+)")
+_YEAR_RE = re.compile(r"20\d{2}")
+# The Arena export page is a tiny document whose only payload is one
+# <textarea>; pulling it out with a regex skips the DOM build entirely
+_TEXTAREA_RE = re.compile(r"<textarea[^>]*>(.*?)</textarea>", re.DOTALL | re.I)
+# Selector equivalent of class_=re.compile(r"deck|card|main|side", re.I),
+# evaluated by soupsieve in one scoped pass instead of a full find_all walk
+_DECK_SECTION_SELECTOR = ", ".join(
+    f'{tag}[class*="{word}" i]'
+    for tag in ("div", "span", "p")
+    for word in ("deck", "card", "main", "side")
+)
+_COMMANDER_LINE_RE = re.compile(r"commander:?\s*(.+)", re.I)
+_SINGLE_CARD_RE = re.compile(r"^1\s+([A-Z][A-Za-z\s\',\-]+)$")
+_AGGRESSIVE_CARD_RE = re.compile(
+    r"(\d+)\s+([A-Z][A-Za-z\s\',\-/]+?)(?=\s+\d+|\s*$|\n)", re.MULTILINE
+)
+
+# Arena export section headers -> internal section names; a single dict
+# probe per line replaces the lowercase/equality cascade
+_SECTION_MAP = {
+    "commander": "commander",
+    "deck": "mainboard",
+    "sideboard": "sideboard",
+}
+
+# Tokens that mark a section as sideboard content; checked with a set
+# intersection on the split text instead of repeated substring scans
+_SIDEBOARD_TOKENS = frozenset({"sideboard", "sb", "side", "board"})
+
+# Non-card vocabulary, folded into single alternation patterns so each
+# check is one C-level scan instead of a Python loop of substring tests
+_EXCLUDED_TERMS = (
+    "tix", "tickets", "price", "cost", "budget", "estimated", "bracket",
+    "mainboard", "sideboard", "commander", "total", "deck", "archetype",
+    "meta", "format", "legal", "banned", "restricted", "$", "€", "¢",
+)
+_EXCLUDED_TERMS_RE = re.compile("|".join(map(re.escape, _EXCLUDED_TERMS)))
+# Matches names that are only digits, spaces and name punctuation — the
+# old replace().replace().isdigit() chain without the temporary strings
+_ALL_DIGITS_RE = re.compile(r"^[\d\s,'\-]+$")
+_GENERIC_TEXT_RE = re.compile(
+    "|".join(map(re.escape, ("deck", "list", "budget", "estimated", "bracket")))
+)
+_COMMON_STAPLES_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "land", "mountain", "island", "forest", "plains", "swamp",
+                "sol ring", "command tower",
+            ),
+        )
+    )
+)
+
+
+@lru_cache(maxsize=2048)
+def _clean_card_name_cached(name: str) -> str:
+    """Clean a raw MTGGoldfish card string, memoized on the raw input.
+
+    The extraction passes re-clean the same staple names constantly, so
+    repeat inputs skip the regex and validation work entirely.
+    """
+    if not name:
+        return ""
+
+    # Remove common suffixes and formatting
+    name = _PAREN_SUFFIX_RE.sub("", name)  # Remove parenthetical info
+    name = _BRACKET_SUFFIX_RE.sub("", name)  # Remove bracket info
+    name = name.strip()
+
+    # Handle dual-faced cards
+    if "//" in name:
+        name = name.split("//")[0].strip()
+
+    # Filter out obvious non-card text
+    if _EXCLUDED_TERMS_RE.search(name.lower()):
+        return ""
+
+    # Card names should have reasonable length and contain mostly letters
+    if len(name) < 2 or len(name) > 50:
+        return ""
+
+    # Should contain at least some letters
+    if not any(c.isalpha() for c in name):
+        return ""
+
+    # Should not be all numbers or symbols
+    if _ALL_DIGITS_RE.match(name):
+        return ""
+
+    return name
 
-from importers.deck_import import DeckScraper, UniversalDeck
 
 
 class MTGGoldfishImportScraper(DeckScraper):
     """MTGGoldfish scraper that implements the universal deck import interface."""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Cache-Control": "max-age=0",
-            }
-        )
+    host_pattern = r"mtggoldfish\.com"
+
+    # All instances share the module-level pooled session, so constructing
+    # a scraper allocates nothing beyond the object itself
+    session = _SESSION
 
     def can_handle_url(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
@@ -69,15 +191,21 @@ class MTGGoldfishImportScraper(DeckScraper):
                 print(f"Failed to fetch Arena export page: {response.status_code}")
                 return self._create_placeholder_deck(url)
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Extract deck content from textarea
-            textarea = soup.find("textarea")
-            if not textarea:
-                print("No textarea found in Arena export page")
-                return self._create_placeholder_deck(url)
+            # Extract deck content from the lone textarea; the regex
+            # fast path avoids parsing the page, with BeautifulSoup kept
+            # as the fallback for unexpected markup
+            textarea_match = _TEXTAREA_RE.search(response.text)
+            if textarea_match:
+                deck_content = html_module.unescape(textarea_match.group(1)).strip()
+            else:
+                # response.text reuses the decode requests already did
+                soup = BeautifulSoup(response.text, "lxml")
+                textarea = soup.find("textarea")
+                if not textarea:
+                    print("No textarea found in Arena export page")
+                    return self._create_placeholder_deck(url)
+                deck_content = textarea.get_text().strip()
 
-            deck_content = textarea.get_text().strip()
             if not deck_content:
                 print("Empty deck content in textarea")
                 return self._create_placeholder_deck(url)
@@ -94,6 +222,10 @@ class MTGGoldfishImportScraper(DeckScraper):
     ) -> Optional[Dict[str, str]]:
         """Extract basic deck information from the page."""
         try:
+            # Serializing the DOM to text is the expensive step, so do it
+            # once here and hand the string to the helpers
+            page_text = soup.get_text()
+
             # Try to find deck name from various possible locations
             deck_name = ""
 
@@ -131,21 +263,25 @@ class MTGGoldfishImportScraper(DeckScraper):
                     )
 
             # Detect format from URL or page content
-            deck_format = self._detect_format(soup, url)
+            deck_format = self._detect_format(page_text, url)
 
             return {
                 "name": deck_name or "MTGGoldfish Deck",
                 "format": deck_format,
                 "description": f"Imported from MTGGoldfish",
-                "year": self._extract_year(soup),
+                "year": self._extract_year(page_text),
             }
 
         except Exception as e:
             print(f"Error extracting deck info: {e}")
             return None
 
-    def _detect_format(self, soup: BeautifulSoup, url: str) -> str:
-        """Detect the deck format from URL or page content."""
+    def _detect_format(self, page_text: Optional[str], url: str) -> str:
+        """Detect the deck format from the URL or pre-extracted page text.
+
+        Callers that only have the URL may pass ``page_text=None``; the
+        URL checks still run and the body-text scan is skipped.
+        """
         url_lower = url.lower()
 
         # Check URL for format indicators
@@ -162,19 +298,20 @@ class MTGGoldfishImportScraper(DeckScraper):
         elif "pioneer" in url_lower:
             return "pioneer"
 
-        # Check page content for format indicators
-        page_text = soup.get_text().lower()
-        if "commander" in page_text or "edh" in page_text:
+        # Check page content for format indicators, when text is available
+        if page_text is None:
+            return "unknown"
+        text_lower = page_text.lower()
+        if "commander" in text_lower or "edh" in text_lower:
             return "commander"
-        elif "standard" in page_text:
+        elif "standard" in text_lower:
             return "standard"
 
         return "unknown"
 
-    def _extract_year(self, soup: BeautifulSoup) -> str:
-        """Extract year from page content if available."""
-        page_text = soup.get_text()
-        year_match = re.search(r"20\d{2}", page_text)
+    def _extract_year(self, page_text: str) -> str:
+        """Extract year from pre-extracted page text if available."""
+        year_match = _YEAR_RE.search(page_text)
         return year_match.group() if year_match else ""
 
     def _extract_card_lists(
@@ -199,49 +336,58 @@ class MTGGoldfishImportScraper(DeckScraper):
                             first_cell = cells[0].get_text().strip()
                             second_cell = cells[1].get_text().strip()
 
-                            # Try parsing quantity from first cell
-                            if first_cell.isdigit():
-                                quantity = int(first_cell)
-                                card_name = self._clean_mtggoldfish_card_name(
-                                    second_cell
-                                )
-
-                                if card_name and 1 <= quantity <= 20:
-                                    card_entry = {
-                                        "quantity": quantity,
-                                        "name": card_name,
-                                        "set": "",
-                                        "collector_number": "",
-                                        "scryfall_id": "",
-                                    }
-                                    mainboard.append(card_entry)
+                            # Try parsing quantity from first cell; int()
+                            # scans the string once and the enclosing
+                            # except skips non-numeric cells
+                            quantity = int(first_cell)
+                            card_name = self._clean_mtggoldfish_card_name(second_cell)
+
+                            if card_name and 1 <= quantity <= 20:
+                                card_entry = {
+                                    "quantity": quantity,
+                                    "name": card_name,
+                                    "set": "",
+                                    "collector_number": "",
+                                    "scryfall_id": "",
+                                }
+                                mainboard.append(card_entry)
                         except (ValueError, AttributeError):
                             continue
 
-            # Method 2: Look for specific MTGGoldfish classes or IDs
-            deck_sections = soup.find_all(
-                ["div", "span", "p"], class_=re.compile(r"deck|card|main|side", re.I)
-            )
-            for section in deck_sections:
-                cards = self._parse_card_container(section)
+            # Method 2: Look for specific MTGGoldfish classes or IDs.
+            # Skipped when the table walk already found a full mainboard
+            # (constructed decks never need more rows than that), and
+            # scoped with a selector so the traversal stays out of Python.
+            if len(mainboard) < 40:
+                deck_sections = soup.select(_DECK_SECTION_SELECTOR)
+                for section in deck_sections:
+                    cards = self._parse_card_container(section)
+
+                    section_text = section.get_text().lower()
+                    is_sideboard = not _SIDEBOARD_TOKENS.isdisjoint(
+                        section_text.split()
+                    )
 
-                section_text = section.get_text().lower()
-                is_sideboard = any(
-                    term in section_text for term in ["sideboard", "side board", "sb"]
-                )
+                    if is_sideboard:
+                        sideboard.extend(cards)
+                    else:
+                        mainboard.extend(cards)
 
-                if is_sideboard:
-                    sideboard.extend(cards)
-                else:
-                    mainboard.extend(cards)
+            # A reasonable mainboard means the structured methods worked;
+            # skip the text fallbacks and their full-page serialization
+            if len(mainboard) >= 20:
+                return mainboard, sideboard
+
+            # Methods 3 and 4 both work from page text, so extract it once
+            page_text = soup.get_text()
 
             # Method 3: Fallback to text parsing if structured methods didn't work
             if not mainboard:
-                mainboard, sideboard = self._fallback_card_extraction(soup)
+                mainboard, sideboard = self._fallback_card_extraction(page_text)
 
             # Method 4: If still no cards, try a more aggressive text search
             if not mainboard:
-                mainboard = self._aggressive_card_extraction(soup)
+                mainboard = self._aggressive_card_extraction(page_text)
 
         except Exception as e:
             print(f"Error extracting card lists: {e}")
@@ -262,7 +408,7 @@ class MTGGoldfishImportScraper(DeckScraper):
                     continue
 
                 # Parse card line format: "4 Lightning Bolt" or "4x Lightning Bolt"
-                card_match = re.match(r"(\d+)x?\s+(.+)", card_text)
+                card_match = _CARD_LINE_RE.match(card_text)
                 if card_match:
                     quantity = int(card_match.group(1))
                     card_name = card_match.group(2).strip()
@@ -287,31 +433,35 @@ class MTGGoldfishImportScraper(DeckScraper):
         return cards
 
     def _fallback_card_extraction(
-        self, soup: BeautifulSoup
+        self, page_text: str
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Fallback method to extract cards by parsing page text."""
         mainboard = []
         sideboard = []
 
         try:
-            # Get all text and look for card patterns
-            page_text = soup.get_text()
-            lines = page_text.split("\n")
+            # Lowercase the whole text once for the sideboard checks
+            # instead of allocating a lowered copy of every line
+            lower_lines = page_text.lower().splitlines()
 
             current_section = "mainboard"
 
-            for line in lines:
+            for line, lower_line in zip(page_text.splitlines(), lower_lines):
                 line = line.strip()
                 if not line:
                     continue
 
                 # Check for sideboard indicators
-                if re.search(r"sideboard|side\s*board|sb:", line.lower()):
+                if (
+                    "sideboard" in lower_line
+                    or "side board" in lower_line
+                    or "sb:" in lower_line
+                ):
                     current_section = "sideboard"
                     continue
 
                 # Look for card patterns
-                card_match = re.match(r"(\d+)x?\s+(.+)", line)
+                card_match = _CARD_LINE_RE.match(line)
                 if card_match:
                     quantity = int(card_match.group(1))
                     card_name = card_match.group(2).strip()
@@ -338,69 +488,10 @@ class MTGGoldfishImportScraper(DeckScraper):
 
     def _clean_mtggoldfish_card_name(self, name: str) -> str:
         """Clean card name from MTGGoldfish format."""
-        if not name:
-            return ""
-
-        # Remove common suffixes and formatting
-        name = re.sub(r"\s*\([^)]*\)\s*$", "", name)  # Remove parenthetical info
-        name = re.sub(r"\s*\[[^\]]*\]\s*$", "", name)  # Remove bracket info
-        name = name.strip()
-
-        # Handle dual-faced cards
-        if "//" in name:
-            name = name.split("//")[0].strip()
-
-        # Filter out obvious non-card text
-        excluded_terms = [
-            "tix",
-            "tickets",
-            "price",
-            "cost",
-            "budget",
-            "estimated",
-            "bracket",
-            "mainboard",
-            "sideboard",
-            "commander",
-            "total",
-            "deck",
-            "archetype",
-            "meta",
-            "format",
-            "legal",
-            "banned",
-            "restricted",
-            "$",
-            "€",
-            "¢",
-        ]
-
-        name_lower = name.lower()
-        if any(term in name_lower for term in excluded_terms):
-            return ""
-
-        # Card names should have reasonable length and contain mostly letters
-        if len(name) < 2 or len(name) > 50:
-            return ""
-
-        # Should contain at least some letters
-        if not any(c.isalpha() for c in name):
-            return ""
-
-        # Should not be all numbers or symbols
-        if (
-            name.replace(" ", "")
-            .replace(",", "")
-            .replace("'", "")
-            .replace("-", "")
-            .isdigit()
-        ):
-            return ""
-
-        return name
+        return _clean_card_name_cached(name)
 
-    def _detect_commanders(self, soup: BeautifulSoup, deck_format: str) -> List[str]:
-        """Detect commanders from the page content."""
+    def _detect_commanders(self, page_text: str, deck_format: str) -> List[str]:
+        """Detect commanders from pre-extracted page text."""
         commanders = []
 
         if deck_format.lower() != "commander":
@@ -408,7 +499,6 @@ class MTGGoldfishImportScraper(DeckScraper):
 
         try:
             # Look for commander sections or indicators
-            page_text = soup.get_text()
             lines = page_text.split("\n")
 
             for line in lines:
@@ -421,7 +511,7 @@ class MTGGoldfishImportScraper(DeckScraper):
                     for term in ["commander:", "general:", "commander deck"]
                 ):
                     # Try to extract commander name from the same line or nearby
-                    commander_match = re.search(r"commander:?\s*(.+)", line, re.I)
+                    commander_match = _COMMANDER_LINE_RE.search(line)
                     if commander_match:
                         potential_name = commander_match.group(1).strip()
                         potential_name = self._clean_mtggoldfish_card_name(
@@ -435,22 +525,11 @@ class MTGGoldfishImportScraper(DeckScraper):
                             and any(c.isalpha() for c in potential_name)
                         ):
                             # Make sure it's not generic text
-                            if not any(
-                                word in potential_name.lower()
-                                for word in [
-                                    "deck",
-                                    "list",
-                                    "budget",
-                                    "estimated",
-                                    "bracket",
-                                ]
-                            ):
+                            if not _GENERIC_TEXT_RE.search(potential_name.lower()):
                                 commanders.append(potential_name)
 
                 # Look for "1 [Card Name]" patterns that might be commanders
-                single_card_match = re.match(
-                    r"^1\s+([A-Z][A-Za-z\s\',\-]+)$", line.strip()
-                )
+                single_card_match = _SINGLE_CARD_RE.match(line.strip())
                 if single_card_match:
                     card_name = single_card_match.group(1).strip()
                     card_name = self._clean_mtggoldfish_card_name(card_name)
@@ -458,19 +537,7 @@ class MTGGoldfishImportScraper(DeckScraper):
                     # Only add if it looks like a proper card name
                     if card_name and 3 <= len(card_name) <= 50:
                         # Make sure it's not generic text or common non-commander cards
-                        excluded_words = [
-                            "land",
-                            "mountain",
-                            "island",
-                            "forest",
-                            "plains",
-                            "swamp",
-                            "sol ring",
-                            "command tower",
-                        ]
-                        if not any(
-                            word in card_name.lower() for word in excluded_words
-                        ):
+                        if not _COMMON_STAPLES_RE.search(card_name.lower()):
                             commanders.append(card_name)
 
         except Exception as e:
@@ -478,29 +545,28 @@ class MTGGoldfishImportScraper(DeckScraper):
 
         return commanders
 
-    def _aggressive_card_extraction(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _aggressive_card_extraction(self, page_text: str) -> List[Dict[str, Any]]:
         """Aggressively extract cards from any text content on the page."""
         cards = []
 
         try:
-            # Get all text and split into words
-            all_text = soup.get_text()
-
             # Look for patterns like "4 Lightning Bolt", "1 Sol Ring", etc.
-            # This is more liberal and might catch some false positives
-            import re
-
-            card_pattern = r"(\d+)\s+([A-Z][A-Za-z\s\',\-/]+?)(?=\s+\d+|\s*$|\n)"
-            matches = re.findall(card_pattern, all_text, re.MULTILINE)
-
-            for quantity_str, card_name in matches:
+            # This is more liberal and might catch some false positives.
+            # Duplicates are dropped inline so the cap can stop the scan
+            # early instead of trimming after a second pass.
+            seen_cards = set()
+            for match in _AGGRESSIVE_CARD_RE.finditer(page_text):
                 try:
-                    quantity = int(quantity_str)
+                    quantity = int(match.group(1))
                     if 1 <= quantity <= 20:  # Reasonable limits
-                        clean_name = self._clean_mtggoldfish_card_name(card_name)
+                        clean_name = self._clean_mtggoldfish_card_name(match.group(2))
                         if clean_name and len(clean_name) > 2:  # Not too short
                             # Additional validation - card names usually have capital letters
                             if any(c.isupper() for c in clean_name):
+                                card_key = (clean_name, quantity)
+                                if card_key in seen_cards:
+                                    continue
+                                seen_cards.add(card_key)
                                 cards.append(
                                     {
                                         "quantity": quantity,
@@ -510,20 +576,13 @@ class MTGGoldfishImportScraper(DeckScraper):
                                         "scryfall_id": "",
                                     }
                                 )
+                                if len(cards) >= 100:  # Reasonable limit
+                                    break
                 except (ValueError, AttributeError):
                     continue
 
-            # Remove duplicates
-            seen_cards = set()
-            unique_cards = []
-            for card in cards:
-                card_key = (card["name"], card["quantity"])
-                if card_key not in seen_cards:
-                    seen_cards.add(card_key)
-                    unique_cards.append(card)
-
-            print(f"Aggressive extraction found {len(unique_cards)} unique cards")
-            return unique_cards[:100]  # Limit to reasonable number
+            print(f"Aggressive extraction found {len(cards)} unique cards")
+            return cards
 
         except Exception as e:
             print(f"Error in aggressive card extraction: {e}")
@@ -651,8 +710,6 @@ class MTGGoldfishImportScraper(DeckScraper):
     def _parse_arena_format(self, content: str, original_url: str) -> UniversalDeck:
         """Parse MTGGoldfish Arena export format."""
         try:
-            lines = content.split("\n")
-
             # Initialize deck data
             deck_name = "MTGGoldfish Deck"
             commanders = []
@@ -660,29 +717,24 @@ class MTGGoldfishImportScraper(DeckScraper):
             sideboard = []
             current_section = "mainboard"
 
-            for line in lines:
+            for line in content.splitlines():
                 line = line.strip()
                 if not line:
                     continue
 
                 # Parse header information
-                if line.startswith("Name "):
+                if line[:5] == "Name ":
                     deck_name = line[5:].strip()  # Remove "Name " prefix
                     continue
 
-                # Section headers
-                if line.lower() == "commander":
-                    current_section = "commander"
-                    continue
-                elif line.lower() == "deck":
-                    current_section = "mainboard"
-                    continue
-                elif line.lower() == "sideboard":
-                    current_section = "sideboard"
+                # Section headers resolve in one dict probe
+                section = _SECTION_MAP.get(line.lower())
+                if section is not None:
+                    current_section = section
                     continue
 
                 # Parse card lines (format: "4 Lightning Bolt")
-                card_match = re.match(r"(\d+)\s+(.+)", line)
+                card_match = _QTY_LINE_RE.match(line)
                 if card_match:
                     quantity = int(card_match.group(1))
                     card_name = card_match.group(2).strip()
@@ -735,7 +787,7 @@ class MTGGoldfishImportScraper(DeckScraper):
             return ""
 
         # Remove any trailing parentheses or set info
-        name = re.sub(r"\s*\([^)]*\)\s*$", "", name)
+        name = _PAREN_SUFFIX_RE.sub("", name)
         name = name.strip()
 
         # Handle dual-faced cards
@@ -752,34 +804,30 @@ class MTGGoldfishImportScraper(DeckScraper):
         """Extract the first deck ID from an MTGGoldfish archetype page."""
         try:
             print(f"Fetching archetype page: {archetype_url}")
-            response = self.session.get(archetype_url, timeout=30)
-
-            if response.status_code != 200:
-                print(f"Failed to fetch archetype page: {response.status_code}")
-                return None
-
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Look for deck links in the format /deck/NUMBER
-            deck_links = []
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-
-                # Look for deck links like /deck/7432842
-                if re.match(r"/deck/\d+$", href):
-                    deck_id = href.split("/deck/")[-1]
-                    if deck_id not in deck_links:  # Avoid duplicates
-                        deck_links.append(deck_id)
-
-            if deck_links:
-                first_deck_id = deck_links[0]
-                print(
-                    f"Found {len(deck_links)} deck(s) on archetype page, using first deck: {first_deck_id}"
-                )
-                return first_deck_id
-            else:
-                print("No deck links found on archetype page")
-                return None
+            # Stream the page and parse it incrementally: the first deck
+            # link usually appears within the first few kilobytes, so the
+            # rest of the page is never downloaded or parsed at all
+            with self.session.get(archetype_url, stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    print(f"Failed to fetch archetype page: {response.status_code}")
+                    return None
+
+                parser = etree.HTMLPullParser(events=("start",))
+                for chunk in response.iter_content(8192):
+                    parser.feed(chunk)
+                    for _event, element in parser.read_events():
+                        if element.tag != "a":
+                            continue
+                        match = _DECK_HREF_RE.match(element.get("href") or "")
+                        if match:
+                            first_deck_id = match.group(1)
+                            print(
+                                f"Using first deck on archetype page: {first_deck_id}"
+                            )
+                            return first_deck_id
+
+            print("No deck links found on archetype page")
+            return None
 
         except Exception as e:
             print(f"Error extracting deck from archetype: {e}")
@@ -7,45 +7,87 @@ replacing the Moxfield-based system with a more comprehensive data source.
 
 import json
 import os
+import shutil
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+
+try:
+    # orjson parses the multi-MB decklist several times faster than
+    # stdlib json; fall back silently when it isn't installed
+    from orjson import loads as _json_loads, dumps as _json_dump_compact
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_compact(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+try:
+    # zstd decompresses at memory speed; stdlib zlib covers the common
+    # case where zstandard isn't installed
+    from zstandard import ZstdCompressor, ZstdDecompressor
+
+    _cache_compress = ZstdCompressor(level=3).compress
+    _cache_decompress = ZstdDecompressor().decompress
+except ImportError:
+    import zlib
+
+    _cache_compress = zlib.compress
+    _cache_decompress = zlib.decompress
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-import urllib.request
-import urllib.error
-from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class MTGDeck:
-    """Wrapper class for MTGJSON deck data to provide object-like access."""
+    """Wrapper class for MTGJSON deck data to provide object-like access.
+
+    The fields the filter and sort loops touch are unpacked into slots up
+    front, so hot accesses are plain attribute loads instead of going
+    through ``__getattr__`` for every deck on every pass.
+    """
+
+    __slots__ = ("_data", "source", "name", "type", "code", "releaseDate", "fileName")
 
     def __init__(self, deck_data: Dict[str, Any]):
         """Initialize from MTGJSON deck dictionary."""
         self._data = deck_data
         self.source = "MTGJSON"  # Mark as MTGJSON deck for GUI
+        self.name = deck_data.get("name", "")
+        self.type = deck_data.get("type", "Unknown")
+        self.code = deck_data.get("code", "")
+        self.releaseDate = deck_data.get("releaseDate", "")
+        self.fileName = deck_data.get("fileName", "")
 
     def __getattr__(self, name: str):
-        """Allow attribute-style access to deck data."""
-        if name in self._data:
-            return self._data[name]
+        """Allow attribute-style access to the remaining deck data."""
+        # Only reached for attributes that are not slots
+        data = self._data
+        if name in data:
+            return data[name]
         # Map common attribute names
-        attr_map = {
-            "deckname": "name",
-            "deck_name": "name",
-        }
-        if name in attr_map and attr_map[name] in self._data:
-            return self._data[attr_map[name]]
+        if name in ("deckname", "deck_name") and "name" in data:
+            return data["name"]
         raise AttributeError(
             f"'{self.__class__.__name__}' object has no attribute '{name}'"
         )
 
     def to_cockatrice(self):
         """Convert MTGJSON deck to Cockatrice format."""
-        from importers.deck_import import UniversalDeck, convert_universal_to_cockatrice
+        from .deck_import import UniversalDeck, convert_universal_to_cockatrice
         from utils.deck_filters import DeckFilters
 
-        # Get the scraper instance to fetch deck details
-        scraper = MTGJsonScraper()
+        # Get the shared scraper instance to fetch deck details
+        scraper = _default_scraper()
 
         # Fetch full deck details
         filename = getattr(self, "fileName", "") + ".json"
@@ -59,10 +101,11 @@ class MTGDeck:
 
         data = deck_details.get("data", {})
 
-        # Convert mainboard cards
-        mainboard = []
-        for card in data.get("mainBoard", []):
-            mainboard.append(
+        # Convert both boards in one comprehension each; the loop body is
+        # a single dict display, so the interpreter builds each card dict
+        # in one bytecode op instead of append-per-field
+        def board_cards(board):
+            return [
                 {
                     "name": card.get("name", ""),
                     "quantity": card.get("count", 1),
@@ -70,25 +113,14 @@ class MTGDeck:
                     "collector_number": card.get("number", ""),
                     "uuid": card.get("uuid", ""),
                 }
-            )
-
-        # Convert sideboard cards
-        sideboard = []
-        for card in data.get("sideBoard", []):
-            sideboard.append(
-                {
-                    "name": card.get("name", ""),
-                    "quantity": card.get("count", 1),
-                    "set": card.get("setCode", ""),
-                    "collector_number": card.get("number", ""),
-                    "uuid": card.get("uuid", ""),
-                }
-            )
+                for card in board
+            ]
 
-        # Get commanders
-        commanders = []
-        for commander in data.get("commander", []):
-            commanders.append(commander.get("name", ""))
+        mainboard = board_cards(data.get("mainBoard", []))
+        sideboard = board_cards(data.get("sideBoard", []))
+        commanders = [
+            commander.get("name", "") for commander in data.get("commander", [])
+        ]
 
         # Determine format
         filters = DeckFilters()
@@ -123,6 +155,9 @@ class MTGJsonScraper:
     with comprehensive filtering and caching capabilities.
     """
 
+    # Upper bound for the in-process deck-details memo
+    DETAILS_MEM_MAX = 512
+
     def __init__(self, cache_dir: str = "cache"):
         """
         Initialize the MTGJSON scraper.
@@ -136,15 +171,124 @@ class MTGJsonScraper:
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(exist_ok=True)
-        (self.cache_dir / "deck_details").mkdir(exist_ok=True)
 
         # Cache file paths
         self.decklist_cache = self.cache_dir / "mtgjson_decklist.json"
         self.cache_metadata = self.cache_dir / "cache_metadata.json"
 
+        # Deck details live in one SQLite table instead of thousands of
+        # small JSON files: one open fd, constant-time lookups, and a
+        # cache clear that is a single DELETE. The ts column doubles as
+        # the per-deck fetch timestamp the metadata file used to track.
+        self._db = sqlite3.connect(
+            str(self.cache_dir / "deck_details.db"),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db_lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS decks (fname TEXT PRIMARY KEY, ts REAL, body BLOB)"
+        )
+
+        # Metadata memo; mutations write through, reads stay in memory
+        self._meta_mem: Optional[Dict[str, Any]] = None
+
+        # LRU memo of parsed deck details, so repeated GUI actions on the
+        # same deck (preview then import) skip even the SQLite read
+        self._details_mem: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # In-memory decklist memo so repeated GUI refreshes don't
+        # re-read and re-parse the multi-MB cache file; keyed on the
+        # cache file's mtime for invalidation
+        self._decklist_mem: Optional[List["MTGDeck"]] = None
+        self._decklist_mem_mtime = 0.0
+        self._deck_types_mem: Optional[List[str]] = None
+        # Lowercased names aligned with the memoized list, plus one
+        # joined buffer so a search-box miss is a single C-level scan
+        self._names_lower: Optional[List[str]] = None
+        self._names_joined: Optional[str] = None
+        # Load-time indices for O(1) lookups on the memoized list
+        self._by_filename: Dict[str, "MTGDeck"] = {}
+        self._by_code: Dict[str, List["MTGDeck"]] = {}
+        self._by_type: Dict[str, List["MTGDeck"]] = {}
+
+        # One keep-alive session serves every MTGJSON request; retries
+        # with backoff are handled by urllib3 instead of a manual loop
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=1,
+                    status_forcelist=[502, 503, 504],
+                ),
+            ),
+        )
+
         # Initialize cache metadata
         self._init_cache_metadata()
 
+    def close(self):
+        """Close the underlying HTTP session and cache database."""
+        self._session.close()
+        self._db.close()
+
+    def _cache_get(self, deck_filename: str) -> Optional[Dict[str, Any]]:
+        """Look up cached deck details, migrating any legacy JSON file."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT body FROM decks WHERE fname = ?", (deck_filename,)
+            ).fetchone()
+        if row is not None:
+            try:
+                body = row[0]
+                try:
+                    body = _cache_decompress(body)
+                except Exception:
+                    pass  # Rows written before compression are raw JSON
+                return _json_loads(body)
+            except ValueError:
+                return None
+
+        # Migrate per-file caches written by older versions on first hit
+        legacy_file = self.cache_dir / "deck_details" / deck_filename
+        if legacy_file.exists():
+            try:
+                deck_data = _json_loads(legacy_file.read_bytes())
+            except (OSError, ValueError):
+                return None
+            self._cache_put(deck_filename, deck_data)
+            return deck_data
+
+        return None
+
+    def _details_mem_put(self, deck_filename: str, deck_data: Dict[str, Any]):
+        """Remember parsed deck details, evicting the oldest past the cap."""
+        mem = self._details_mem
+        mem[deck_filename] = deck_data
+        mem.move_to_end(deck_filename)
+        while len(mem) > self.DETAILS_MEM_MAX:
+            mem.popitem(last=False)
+
+    def _cache_put(self, deck_filename: str, deck_data: Dict[str, Any]):
+        """Store deck details in the cache database."""
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO decks (fname, ts, body) VALUES (?, ?, ?)",
+                (
+                    deck_filename,
+                    time.time(),
+                    # Compact JSON (no indentation) compresses to a
+                    # fraction of the pretty-printed size
+                    _cache_compress(_json_dump_compact(deck_data)),
+                ),
+            )
+
     def _init_cache_metadata(self):
         """Initialize cache metadata file if it doesn't exist."""
         if not self.cache_metadata.exists():
@@ -153,26 +297,80 @@ class MTGJsonScraper:
                 "fetched_decks": {},
                 "cache_version": "1.0",
             }
-            with open(self.cache_metadata, "w") as f:
-                json.dump(metadata, f, indent=2)
+            self.cache_metadata.write_bytes(_json_dump_compact(metadata))
 
     def _load_cache_metadata(self) -> Dict[str, Any]:
-        """Load cache metadata from file."""
+        """Load cache metadata, reading the file only once per process."""
+        if self._meta_mem is not None:
+            return self._meta_mem
         try:
-            with open(self.cache_metadata, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            self._meta_mem = _json_loads(self.cache_metadata.read_bytes())
+        except (FileNotFoundError, ValueError):
             self._init_cache_metadata()
-            return self._load_cache_metadata()
+            self._meta_mem = _json_loads(self.cache_metadata.read_bytes())
+        return self._meta_mem
 
     def _save_cache_metadata(self, metadata: Dict[str, Any]):
-        """Save cache metadata to file."""
-        with open(self.cache_metadata, "w") as f:
-            json.dump(metadata, f, indent=2)
+        """Save cache metadata, writing through to disk."""
+        self._meta_mem = metadata
+        self.cache_metadata.write_bytes(_json_dump_compact(metadata))
+
+    def _is_cache_valid(self, timestamp: float, now: Optional[float] = None) -> bool:
+        """Check if cache timestamp is still valid.
+
+        Callers that already hold a time.time() snapshot can pass it in
+        so one clock read covers the whole operation.
+        """
+        if now is None:
+            now = time.time()
+        return now - timestamp < self.cache_duration
+
+    def _load_decklist_file(self) -> List[Dict[str, Any]]:
+        """Decode the decklist cache file into a list of deck dicts.
+
+        Streamed caches hold the server payload verbatim (a dict with a
+        "data" key); older caches held the bare list. Accept both.
+        """
+        payload = _json_loads(self.decklist_cache.read_bytes())
+        if isinstance(payload, dict):
+            return payload.get("data", [])
+        return payload
+
+    def _remember_decklist(self, decks: List["MTGDeck"]) -> List["MTGDeck"]:
+        """Memoize the parsed decklist against the cache file's mtime.
 
-    def _is_cache_valid(self, timestamp: float) -> bool:
-        """Check if cache timestamp is still valid."""
-        return time.time() - timestamp < self.cache_duration
+        The list is stored newest-first so callers never have to re-sort
+        it; filtering preserves this order.
+        """
+        decks.sort(key=attrgetter("releaseDate"), reverse=True)
+        self._decklist_mem = decks
+        try:
+            self._decklist_mem_mtime = self.decklist_cache.stat().st_mtime
+        except OSError:
+            self._decklist_mem_mtime = 0.0
+        self._deck_types_mem = None
+        self._names_lower = [deck.name.lower() for deck in decks]
+        self._names_joined = "\n".join(self._names_lower)
+
+        # Index by fileName, set code and type; the buckets inherit the
+        # newest-first order from the sort above
+        by_filename: Dict[str, "MTGDeck"] = {}
+        by_code: Dict[str, List["MTGDeck"]] = defaultdict(list)
+        by_type: Dict[str, List["MTGDeck"]] = defaultdict(list)
+        for deck in decks:
+            by_filename[deck.fileName] = deck
+            by_code[deck.code].append(deck)
+            by_type[deck.type].append(deck)
+        self._by_filename = by_filename
+        self._by_code = by_code
+        self._by_type = by_type
+        return decks
+
+    def get_deck_by_filename(self, file_name: str) -> Optional["MTGDeck"]:
+        """Look up a deck from the current list by its MTGJSON fileName."""
+        if self._decklist_mem is None:
+            self.fetch_deck_list()
+        return self._by_filename.get(file_name)
 
     def _fetch_url(self, url: str) -> Dict[str, Any]:
         """
@@ -187,24 +385,12 @@ class MTGJsonScraper:
         Raises:
             Exception: If fetch fails after retries
         """
-        max_retries = 3
-        retry_delay = 1
-
-        for attempt in range(max_retries):
-            try:
-                with urllib.request.urlopen(url, timeout=30) as response:
-                    data = response.read().decode("utf-8")
-                    return json.loads(data)
-            except (
-                urllib.error.URLError,
-                urllib.error.HTTPError,
-                json.JSONDecodeError,
-            ) as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"Failed to fetch data from {url}: {e}")
-                time.sleep(retry_delay * (2**attempt))  # Exponential backoff
-
-        raise Exception(f"Failed to fetch data from {url} after {max_retries} attempts")
+        try:
+            response = self._session.get(url, timeout=30)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            raise Exception(f"Failed to fetch data from {url}: {e}")
 
     def fetch_deck_list(self, force_refresh: bool = False) -> List[MTGDeck]:
         """
@@ -217,46 +403,98 @@ class MTGJsonScraper:
             List of deck metadata dictionaries
         """
         metadata = self._load_cache_metadata()
+        # One clock read serves the TTL check and any stamps below
+        now = time.time()
 
         # Check if we need to fetch fresh data
-        if not force_refresh and self._is_cache_valid(metadata["last_decklist_fetch"]):
+        if not force_refresh and self._is_cache_valid(
+            metadata["last_decklist_fetch"], now
+        ):
+            # Serve the in-memory copy while the cache file is unchanged
+            if self._decklist_mem is not None:
+                try:
+                    if (
+                        self.decklist_cache.stat().st_mtime
+                        == self._decklist_mem_mtime
+                    ):
+                        return self._decklist_mem
+                except OSError:
+                    pass
             if self.decklist_cache.exists():
                 try:
-                    with open(self.decklist_cache, "r", encoding="utf-8") as f:
-                        deck_data = json.load(f)
-                        return [MTGDeck(deck) for deck in deck_data]
-                except (FileNotFoundError, json.JSONDecodeError):
+                    deck_data = self._load_decklist_file()
+                    return self._remember_decklist(
+                        [MTGDeck(deck) for deck in deck_data]
+                    )
+                except (FileNotFoundError, ValueError):
                     pass  # Fall through to fetch fresh data
 
         # Fetch fresh deck list
         print("Fetching deck list from MTGJSON...")
-        url = urljoin(self.base_url, "DeckList.json")
+        url = f"{self.base_url}DeckList.json"
 
         try:
-            response_data = self._fetch_url(url)
-            deck_list = response_data.get("data", [])
-
-            # Cache the results
-            with open(self.decklist_cache, "w", encoding="utf-8") as f:
-                json.dump(deck_list, f, indent=2, ensure_ascii=False)
+            # Validate the cached copy with a conditional GET: the TTL
+            # decides when to ask, the ETag/Last-Modified pair decides
+            # whether any bytes actually transfer
+            request_headers = {}
+            if self.decklist_cache.exists():
+                if metadata.get("decklist_etag"):
+                    request_headers["If-None-Match"] = metadata["decklist_etag"]
+                if metadata.get("decklist_last_modified"):
+                    request_headers["If-Modified-Since"] = metadata[
+                        "decklist_last_modified"
+                    ]
+
+            # Stream the multi-MB response straight to disk and rename it
+            # into place, then parse from the file: the server's bytes are
+            # kept verbatim and no re-serialization pass is needed
+            tmp_path = self.decklist_cache.with_name(self.decklist_cache.name + ".tmp")
+            with self._session.get(
+                url, stream=True, timeout=30, headers=request_headers
+            ) as response:
+                if response.status_code == 304:
+                    # Unchanged upstream: just extend the TTL and serve
+                    # the copy we already have
+                    print("Deck list unchanged upstream (304), using cache")
+                    metadata["last_decklist_fetch"] = now
+                    self._save_cache_metadata(metadata)
+                    if self._decklist_mem is not None:
+                        return self._decklist_mem
+                    deck_data = self._load_decklist_file()
+                    return self._remember_decklist(
+                        [MTGDeck(deck) for deck in deck_data]
+                    )
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(1 << 16):
+                        f.write(chunk)
+                response_etag = response.headers.get("ETag", "")
+                response_last_modified = response.headers.get("Last-Modified", "")
+            os.replace(tmp_path, self.decklist_cache)
+
+            deck_list = self._load_decklist_file()
 
             # Update metadata
-            metadata["last_decklist_fetch"] = time.time()
+            metadata["last_decklist_fetch"] = now
+            metadata["decklist_etag"] = response_etag
+            metadata["decklist_last_modified"] = response_last_modified
             self._save_cache_metadata(metadata)
 
             print(f"Successfully cached {len(deck_list)} decks")
-            return [MTGDeck(deck) for deck in deck_list]
+            return self._remember_decklist([MTGDeck(deck) for deck in deck_list])
 
         except Exception as e:
             print(f"Error fetching deck list: {e}")
             # Try to return cached data if available
             if self.decklist_cache.exists():
                 try:
-                    with open(self.decklist_cache, "r", encoding="utf-8") as f:
-                        print("Using cached deck list due to fetch error")
-                        deck_data = json.load(f)
-                        return [MTGDeck(deck) for deck in deck_data]
-                except (FileNotFoundError, json.JSONDecodeError):
+                    print("Using cached deck list due to fetch error")
+                    deck_data = self._load_decklist_file()
+                    return self._remember_decklist(
+                        [MTGDeck(deck) for deck in deck_data]
+                    )
+                except (FileNotFoundError, ValueError):
                     pass
 
             raise Exception(
@@ -276,37 +514,89 @@ class MTGJsonScraper:
         Returns:
             Deck details dictionary or None if not found
         """
-        cache_file = self.cache_dir / "deck_details" / deck_filename
-        metadata = self._load_cache_metadata()
-
-        # Check cache first (deck details are cached indefinitely unless forced)
-        if not force_refresh and cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass  # Fall through to fetch fresh data
+        # Check caches first (deck details are cached indefinitely
+        # unless forced): the in-process memo, then the SQLite store
+        if force_refresh:
+            self._details_mem.pop(deck_filename, None)
+        else:
+            cached = self._details_mem.get(deck_filename)
+            if cached is not None:
+                self._details_mem.move_to_end(deck_filename)
+                return cached
+            cached = self._cache_get(deck_filename)
+            if cached is not None:
+                self._details_mem_put(deck_filename, cached)
+                return cached
 
         # Fetch fresh deck details
-        url = urljoin(self.base_url, f"decks/{deck_filename}")
-
         try:
-            deck_data = self._fetch_url(url)
-
-            # Cache the results
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(deck_data, f, indent=2, ensure_ascii=False)
-
-            # Update metadata
-            metadata["fetched_decks"][deck_filename] = time.time()
-            self._save_cache_metadata(metadata)
-
+            deck_data = self._fetch_single(deck_filename)
+            self._details_mem_put(deck_filename, deck_data)
             return deck_data
-
         except Exception as e:
             print(f"Error fetching deck details for {deck_filename}: {e}")
             return None
 
+    def _fetch_single(self, deck_filename: str) -> Dict[str, Any]:
+        """Fetch and cache one deck's details without touching metadata.
+
+        Split out so concurrent bulk fetches can share the body.
+        """
+        url = f"{self.base_url}decks/{deck_filename}"
+        deck_data = self._fetch_url(url)
+        self._cache_put(deck_filename, deck_data)
+        return deck_data
+
+    def fetch_many_deck_details(
+        self,
+        deck_filenames: List[str],
+        max_workers: int = 16,
+        force_refresh: bool = False,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch details for several decks concurrently.
+
+        Cached decks are returned without any network traffic; only the
+        misses go through the thread pool, which shares the keep-alive
+        session.
+
+        Args:
+            deck_filenames: Deck filenames (e.g. "AdaptiveEnchantment_C18.json")
+            max_workers: Maximum number of worker threads
+            force_refresh: If True, bypass cache and fetch fresh data
+
+        Returns:
+            Dict mapping each filename to its details (None for failures)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+
+        for deck_filename in deck_filenames:
+            if not force_refresh:
+                cached = self._cache_get(deck_filename)
+                if cached is not None:
+                    results[deck_filename] = cached
+                    continue
+            missing.append(deck_filename)
+
+        if not missing:
+            return results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_single, deck_filename): deck_filename
+                for deck_filename in missing
+            }
+            for future in as_completed(futures):
+                deck_filename = futures[future]
+                try:
+                    results[deck_filename] = future.result()
+                except Exception as e:
+                    print(f"Error fetching deck details for {deck_filename}: {e}")
+                    results[deck_filename] = None
+
+        return results
+
     def get_available_deck_types(self) -> List[str]:
         """
         Get list of all available deck types from the cached deck list.
@@ -315,6 +605,10 @@ class MTGJsonScraper:
             Sorted list of unique deck types
         """
         try:
+            # Recomputed only when the decklist memo is refreshed
+            if self._deck_types_mem is not None:
+                return self._deck_types_mem
+
             deck_list = self.fetch_deck_list()
             deck_types = set()
 
@@ -322,7 +616,8 @@ class MTGJsonScraper:
                 deck_type = getattr(deck, "type", "Unknown")
                 deck_types.add(deck_type)
 
-            return sorted(deck_types)
+            self._deck_types_mem = sorted(deck_types)
+            return self._deck_types_mem
 
         except Exception as e:
             print(f"Error getting deck types: {e}")
@@ -352,64 +647,70 @@ class MTGJsonScraper:
         if deck_list is None:
             deck_list = self.fetch_deck_list()
 
-        filtered_decks = deck_list.copy()
+        # Resolve all predicate state once, then filter in a single pass
+        # instead of one full list walk (and intermediate list) per
+        # criterion. Membership tests run against sets.
+        type_set = set(deck_types) if deck_types else None
+        code_set = set(set_codes) if set_codes else None
+        name_filter_lower = name_filter.lower() if name_filter else None
 
-        # Filter by deck types
-        if deck_types:
-            filtered_decks = [
-                deck
-                for deck in filtered_decks
-                if getattr(deck, "type", "") in deck_types
-            ]
-
-        # Filter by date range
+        # ISO dates compare correctly as strings, so after validating the
+        # bounds once there is no per-deck parsing at all
+        start_date = end_date = None
         if date_range:
             start_date, end_date = date_range
             try:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-                filtered_decks = [
-                    deck
-                    for deck in filtered_decks
-                    if self._is_deck_in_date_range(deck, start_dt, end_dt)
-                ]
+                date.fromisoformat(start_date)
+                date.fromisoformat(end_date)
             except ValueError as e:
                 print(f"Invalid date format: {e}")
-
-        # Filter by set codes
-        if set_codes:
-            filtered_decks = [
-                deck
-                for deck in filtered_decks
-                if getattr(deck, "code", "") in set_codes
-            ]
-
-        # Filter by name
-        if name_filter:
-            name_filter_lower = name_filter.lower()
-            filtered_decks = [
-                deck
-                for deck in filtered_decks
-                if name_filter_lower in getattr(deck, "name", "").lower()
-            ]
+                start_date = end_date = None
+
+        # The common GUI calls filter on a single deck type (or set
+        # code) with no other criteria; those are answered straight from
+        # the load-time indices without scanning the list
+        if (
+            deck_list is self._decklist_mem
+            and start_date is None
+            and name_filter_lower is None
+        ):
+            if type_set is not None and code_set is None and len(type_set) == 1:
+                return list(self._by_type.get(next(iter(type_set)), ()))
+            if code_set is not None and type_set is None and len(code_set) == 1:
+                return list(self._by_code.get(next(iter(code_set)), ()))
+
+        # When filtering the memoized list by name, reuse its lowercased
+        # names, and bail out through the joined buffer when nothing can
+        # match at all (the common case while a search term is typed)
+        names_lower = None
+        if name_filter_lower is not None and deck_list is self._decklist_mem:
+            if (
+                self._names_joined is not None
+                and self._names_joined.find(name_filter_lower) == -1
+            ):
+                return []
+            names_lower = self._names_lower
+
+        filtered_decks = []
+        for i, deck in enumerate(deck_list):
+            if type_set is not None and deck.type not in type_set:
+                continue
+            if start_date is not None:
+                release_date = deck.releaseDate
+                if not (release_date and start_date <= release_date <= end_date):
+                    continue
+            if code_set is not None and deck.code not in code_set:
+                continue
+            if name_filter_lower is not None:
+                name = (
+                    names_lower[i] if names_lower is not None else deck.name.lower()
+                )
+                if name_filter_lower not in name:
+                    continue
+            filtered_decks.append(deck)
 
         return filtered_decks
 
-    def _is_deck_in_date_range(
-        self, deck: Dict[str, Any], start_date: datetime, end_date: datetime
-    ) -> bool:
-        """Check if deck release date falls within the specified range."""
-        release_date_str = getattr(deck, "releaseDate", "")
-        if not release_date_str:
-            return False
-
-        try:
-            release_date = datetime.strptime(release_date_str, "%Y-%m-%d")
-            return start_date <= release_date <= end_date
-        except ValueError:
-            return False
-
     def get_deck_summary(self, deck_metadata: Dict[str, Any]) -> Dict[str, str]:
         """
         Convert MTGJSON deck metadata to format expected by GUI.
@@ -450,13 +751,10 @@ class MTGJsonScraper:
                 deck_types = ["Commander Deck"]
 
             deck_list = self.fetch_deck_list()
+            # The decklist is kept sorted newest-first, and filtering
+            # preserves that order, so no per-call sort is needed
             filtered_decks = self.filter_decks(deck_list, deck_types=deck_types)
 
-            # Sort by release date (newest first)
-            filtered_decks.sort(
-                key=lambda x: getattr(x, "releaseDate", ""), reverse=True
-            )
-
             # Apply limit if specified
             if limit:
                 filtered_decks = filtered_decks[:limit]
@@ -476,11 +774,27 @@ class MTGJsonScraper:
                 self.decklist_cache.unlink()
 
             # Clear deck details cache
+            with self._db_lock:
+                self._db.execute("DELETE FROM decks")
+
+            # Remove any legacy per-file caches as well
             deck_details_dir = self.cache_dir / "deck_details"
             if deck_details_dir.exists():
                 for file in deck_details_dir.glob("*.json"):
                     file.unlink()
 
+            # Drop the in-memory memos too, so nothing keeps serving
+            # payloads whose disk rows were just deleted
+            self._details_mem.clear()
+            self._decklist_mem = None
+            self._decklist_mem_mtime = 0.0
+            self._deck_types_mem = None
+            self._names_lower = None
+            self._names_joined = None
+            self._by_filename = {}
+            self._by_code = {}
+            self._by_type = {}
+
             # Reset metadata
             self._init_cache_metadata()
             print("Cache cleared successfully")
@@ -490,6 +804,20 @@ class MTGJsonScraper:
 
 
 # Compatibility function for existing code
+# Process-wide scraper shared by to_cockatrice and the convenience
+# function, so batch conversions reuse one session, metadata memo and
+# deck-details cache instead of constructing a scraper per deck
+_DEFAULT_SCRAPER: Optional[MTGJsonScraper] = None
+
+
+def _default_scraper() -> MTGJsonScraper:
+    """Return the lazily created shared MTGJsonScraper instance."""
+    global _DEFAULT_SCRAPER
+    if _DEFAULT_SCRAPER is None:
+        _DEFAULT_SCRAPER = MTGJsonScraper()
+    return _DEFAULT_SCRAPER
+
+
 def get_mtgjson_precons(
     deck_types: Optional[List[str]] = None, limit: Optional[int] = None
 ) -> List[Dict[str, str]]:
@@ -503,8 +831,7 @@ def get_mtgjson_precons(
     Returns:
         List of deck summaries
     """
-    scraper = MTGJsonScraper()
-    return scraper.get_preconstructed_decks(deck_types=deck_types, limit=limit)
+    return _default_scraper().get_preconstructed_decks(deck_types=deck_types, limit=limit)
 
 
 if __name__ == "__main__":
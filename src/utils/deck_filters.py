@@ -4,10 +4,17 @@ Deck filtering utilities for MTGJSON integration.
 Provides advanced filtering capabilities for deck selection and categorization.
 """
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Dict, List, Optional, Set, Any, Tuple, TYPE_CHECKING
 import re
 
+# Filename markers identifying Commander products
+_CMD_FILENAME_MARKERS = ("_CMD", "_CMR", "_AFC")
+
 if TYPE_CHECKING:
     from importers.mtgjson_scraper import MTGDeck
 
@@ -47,6 +54,16 @@ class DeckFilters:
 
     LIMITED_TYPES = {"Jumpstart", "Welcome Deck", "Sample Deck", "Demo Deck"}
 
+    # Inverted category lookup built once at class definition; categorizing
+    # a deck type is a single dict probe instead of up to five set checks
+    _TYPE_TO_CATEGORY = (
+        {t: "Competitive" for t in COMPETITIVE_TYPES}
+        | {t: "Casual" for t in CASUAL_TYPES}
+        | {t: "Premium" for t in PREMIUM_TYPES}
+        | {t: "Duel" for t in DUEL_TYPES}
+        | {t: "Limited" for t in LIMITED_TYPES}
+    )
+
     # Format associations based on deck types and naming patterns
     FORMAT_INDICATORS = {
         "Standard": ["Standard", "Challenger Deck", "Intro Pack"],
@@ -59,6 +76,22 @@ class DeckFilters:
         "Limited": ["Jumpstart", "Cube", "Draft"],
     }
 
+    # Power-level keywords in priority order, pre-lowered; the first
+    # matching tier wins, so one scan of the deck type answers the call
+    _POWER_KEYWORDS = (
+        ("High Power", ("pro tour", "world championship", "modern event")),
+        ("Optimized", ("challenger deck", "event deck")),
+        ("Focused", ("premium deck", "commander deck")),
+        ("Casual", ("intro pack", "theme deck", "starter", "welcome")),
+    )
+
+    # Indicators pre-lowered once at class definition so infer_format
+    # matches case-insensitively without re-lowering either side per call
+    _FORMAT_INDICATORS_LC = [
+        (fmt, tuple(indicator.lower() for indicator in indicators))
+        for fmt, indicators in FORMAT_INDICATORS.items()
+    ]
+
     @classmethod
     def categorize_deck_type(cls, deck_type: str) -> str:
         """
@@ -70,18 +103,7 @@ class DeckFilters:
         Returns:
             Category name (Competitive, Casual, Premium, Duel, Limited, Other)
         """
-        if deck_type in cls.COMPETITIVE_TYPES:
-            return "Competitive"
-        elif deck_type in cls.CASUAL_TYPES:
-            return "Casual"
-        elif deck_type in cls.PREMIUM_TYPES:
-            return "Premium"
-        elif deck_type in cls.DUEL_TYPES:
-            return "Duel"
-        elif deck_type in cls.LIMITED_TYPES:
-            return "Limited"
-        else:
-            return "Other"
+        return cls._TYPE_TO_CATEGORY.get(deck_type, "Other")
 
     @classmethod
     def infer_format(cls, deck_data: Dict[str, Any]) -> str:
@@ -94,29 +116,11 @@ class DeckFilters:
         Returns:
             Inferred format name or "Unknown"
         """
-        deck_type = deck_data.get("type", "")
-        deck_name = deck_data.get("name", "")
-        set_code = deck_data.get("code", "")
-
-        # Check format indicators
-        for format_name, indicators in cls.FORMAT_INDICATORS.items():
-            for indicator in indicators:
-                if indicator.lower() in deck_type.lower():
-                    return format_name
-
-        # Special cases based on naming patterns
-        if "Commander" in deck_name or set_code.startswith("C"):
-            return "Commander"
-        elif "Standard" in deck_name:
-            return "Standard"
-        elif "Modern" in deck_name:
-            return "Modern"
-        elif "Legacy" in deck_name:
-            return "Legacy"
-        elif "Pioneer" in deck_name:
-            return "Pioneer"
-
-        return "Unknown"
+        return _infer_format_cached(
+            deck_data.get("type", ""),
+            deck_data.get("name", ""),
+            deck_data.get("code", ""),
+        )
 
     @classmethod
     def extract_color_identity(
@@ -134,22 +138,26 @@ class DeckFilters:
         if not deck_details:
             return []
 
-        colors = set()
-
-        # Check commander colors first
+        # Check commander colors first; chain feeds all the per-card
+        # color lists into one C-level set construction
         commanders = deck_details.get("commander", [])
-        for commander in commanders:
-            commander_colors = commander.get("colorIdentity", [])
-            colors.update(commander_colors)
+        colors = set(
+            chain.from_iterable(
+                commander.get("colorIdentity", ()) for commander in commanders
+            )
+        )
 
         # If no commander colors, analyze mainboard (basic approach)
         if not colors:
             mainboard = deck_details.get("mainBoard", [])
-            for card in mainboard[:20]:  # Sample first 20 cards for performance
-                card_colors = card.get("colorIdentity", [])
-                colors.update(card_colors)
+            # Sample first 20 cards for performance
+            colors = set(
+                chain.from_iterable(
+                    card.get("colorIdentity", ()) for card in islice(mainboard, 20)
+                )
+            )
 
-        return sorted(list(colors))
+        return sorted(colors)
 
     @classmethod
     def is_secret_lair(cls, deck_data: Dict[str, Any]) -> bool:
@@ -168,9 +176,7 @@ class DeckFilters:
         return (
             deck_type == "Commander Deck"
             or set_code.startswith("C")
-            or "_CMD" in filename
-            or "_CMR" in filename
-            or "_AFC" in filename
+            or any(marker in filename for marker in _CMD_FILENAME_MARKERS)
         )
 
     @classmethod
@@ -184,23 +190,7 @@ class DeckFilters:
         Returns:
             Era name (Classic, Modern Era, New Era, Current)
         """
-        if not release_date:
-            return "Unknown"
-
-        try:
-            date = datetime.strptime(release_date, "%Y-%m-%d")
-            year = date.year
-
-            if year < 2003:
-                return "Classic (1993-2002)"
-            elif year < 2009:
-                return "Modern Era (2003-2008)"
-            elif year < 2019:
-                return "New Era (2009-2018)"
-            else:
-                return "Current (2019+)"
-        except ValueError:
-            return "Unknown"
+        return _era_cached(release_date)
 
     @classmethod
     def filter_by_power_level(cls, deck_data: Dict[str, Any]) -> str:
@@ -213,33 +203,76 @@ class DeckFilters:
         Returns:
             Power level category (Casual, Focused, Optimized, High Power)
         """
-        deck_type = deck_data.get("type", "")
-        deck_name = deck_data.get("name", "")
-
-        # High power indicators
-        if any(
-            keyword in deck_type
-            for keyword in ["Pro Tour", "World Championship", "Modern Event"]
-        ):
-            return "High Power"
-
-        # Optimized indicators
-        if any(keyword in deck_type for keyword in ["Challenger Deck", "Event Deck"]):
-            return "Optimized"
-
-        # Focused indicators
-        if any(keyword in deck_type for keyword in ["Premium Deck", "Commander Deck"]):
-            return "Focused"
-
-        # Casual indicators
-        if any(
-            keyword in deck_type
-            for keyword in ["Intro Pack", "Theme Deck", "Starter", "Welcome"]
-        ):
-            return "Casual"
+        return _power_cached(deck_data.get("type", ""))
+
+
+
+# Cached workers for the pure classifier methods above. Deck lists reuse
+# the same handful of type/name/date strings thousands of times across
+# multi_filter and the statistics pass, so repeat classifications become
+# single dict probes.
+@lru_cache(maxsize=8192)
+def _infer_format_cached(deck_type: str, deck_name: str, set_code: str) -> str:
+    """Cached body of DeckFilters.infer_format."""
+    deck_type_lower = deck_type.lower()
+
+    # Check format indicators against the pre-lowered table
+    for format_name, indicators in DeckFilters._FORMAT_INDICATORS_LC:
+        for indicator in indicators:
+            if indicator in deck_type_lower:
+                return format_name
+
+    # Special cases based on naming patterns
+    if "Commander" in deck_name or set_code.startswith("C"):
+        return "Commander"
+    elif "Standard" in deck_name:
+        return "Standard"
+    elif "Modern" in deck_name:
+        return "Modern"
+    elif "Legacy" in deck_name:
+        return "Legacy"
+    elif "Pioneer" in deck_name:
+        return "Pioneer"
+
+    return "Unknown"
+
+
+# Era boundaries (exclusive upper years) with their bucket names; a
+# bisect over the edges replaces the if/elif chain
+_ERA_EDGES = (2003, 2009, 2019)
+_ERA_NAMES = (
+    "Classic (1993-2002)",
+    "Modern Era (2003-2008)",
+    "New Era (2009-2018)",
+    "Current (2019+)",
+)
+
+
+@lru_cache(maxsize=4096)
+def _era_cached(release_date: str) -> str:
+    """Cached body of DeckFilters.get_era_from_date."""
+    # Only the year matters for the era, so parse the leading four
+    # digits instead of running the full date through strptime
+    if len(release_date) < 4:
+        return "Unknown"
 
+    try:
+        year = int(release_date[:4])
+    except ValueError:
         return "Unknown"
 
+    return _ERA_NAMES[bisect_right(_ERA_EDGES, year)]
+
+
+@lru_cache(maxsize=4096)
+def _power_cached(deck_type: str) -> str:
+    """Cached body of DeckFilters.filter_by_power_level."""
+    deck_type_lower = deck_type.lower()
+    for power_level, keywords in DeckFilters._POWER_KEYWORDS:
+        if any(keyword in deck_type_lower for keyword in keywords):
+            return power_level
+    return "Unknown"
+
 
 class AdvancedDeckFilter:
     """Advanced filtering functionality for complex deck queries."""
@@ -253,6 +286,19 @@ class AdvancedDeckFilter:
         """
         self.deck_list = deck_list
         self.filters = DeckFilters()
+        # Lowered name/type/code blobs for search_decks, built on first
+        # search; the deck list is fixed at construction so no invalidation
+        self._search_blobs: Optional[List[str]] = None
+        # Per-deck lowered names for text_search, filled on first use
+        self._name_lc: Dict[int, str] = {}
+        # Validated release dates ("" when missing/malformed), parallel to
+        # deck_list; built on the first recency query
+        self._release_dates: Optional[List[str]] = None
+        # Inverted classification indices (value -> deck positions),
+        # built lazily the first time a classified filter is used
+        self._classification_indices: Optional[
+            Tuple[Dict[str, Set[int]], ...]
+        ] = None
 
     def multi_filter(
         self,
@@ -281,102 +327,162 @@ class AdvancedDeckFilter:
         Returns:
             Filtered deck list
         """
-        filtered = self.deck_list.copy()
-
-        # Category filter
-        if categories:
-            filtered = [
-                deck
-                for deck in filtered
-                if self.filters.categorize_deck_type(getattr(deck, "type", ""))
-                in categories
-            ]
+        # The classified filters (category/format/era/power) are answered
+        # from inverted indices built once per filter instance; the cheap
+        # flag and substring filters run as predicates over the survivors.
+        filters = self.filters
+        predicates = []
 
-        # Format filter (requires inference)
-        if formats:
-            filtered = [
-                deck
-                for deck in filtered
-                if self.filters.infer_format(deck._data) in formats
-            ]
-
-        # Era filter
-        if eras:
-            filtered = [
-                deck
-                for deck in filtered
-                if self.filters.get_era_from_date(getattr(deck, "releaseDate", ""))
-                in eras
-            ]
+        if exclude_secret_lair:
+            predicates.append(lambda deck: not filters.is_secret_lair(deck._data))
 
-        # Power level filter
-        if power_levels:
-            filtered = [
-                deck
-                for deck in filtered
-                if self.filters.filter_by_power_level(deck._data) in power_levels
-            ]
+        if commander_only:
+            predicates.append(lambda deck: filters.is_commander_product(deck._data))
 
-        # Text search
         if text_search:
             search_lower = text_search.lower()
-            filtered = [
-                deck
-                for deck in filtered
-                if search_lower in getattr(deck, "name", "").lower()
+            name_lower = self._name_lower
+            predicates.append(lambda deck: search_lower in name_lower(deck))
+
+        candidates: Optional[Set[int]] = None
+        if categories or formats or eras or power_levels:
+            if self._classification_indices is None:
+                self._build_classification_indices()
+            by_category, by_format, by_era, by_power = self._classification_indices
+
+            # OR within a filter, AND across filters
+            for values, index in (
+                (categories, by_category),
+                (formats, by_format),
+                (eras, by_era),
+                (power_levels, by_power),
+            ):
+                if values:
+                    bucket = set().union(*(index.get(v, ()) for v in values))
+                    candidates = (
+                        bucket if candidates is None else candidates & bucket
+                    )
+
+        if candidates is not None:
+            deck_list = self.deck_list
+            return [
+                deck_list[i]
+                for i in sorted(candidates)
+                if all(predicate(deck_list[i]) for predicate in predicates)
             ]
 
-        # Secret Lair exclusion
-        if exclude_secret_lair:
-            filtered = [
-                deck for deck in filtered if not self.filters.is_secret_lair(deck._data)
-            ]
+        if not predicates:
+            return self.deck_list.copy()
 
-        # Commander only
-        if commander_only:
-            filtered = [
-                deck
-                for deck in filtered
-                if self.filters.is_commander_product(deck._data)
-            ]
+        return [
+            deck
+            for deck in self.deck_list
+            if all(predicate(deck) for predicate in predicates)
+        ]
 
-        return filtered
+    def _build_classification_indices(self):
+        """Classify every deck once into four inverted indices.
 
-    def get_filter_statistics(self) -> Dict[str, Dict[str, int]]:
+        Each maps a classification value to the set of deck positions
+        carrying it, so classified filters intersect small sets instead
+        of re-classifying the whole list per call.
+        """
+        by_category: Dict[str, Set[int]] = defaultdict(set)
+        by_format: Dict[str, Set[int]] = defaultdict(set)
+        by_era: Dict[str, Set[int]] = defaultdict(set)
+        by_power: Dict[str, Set[int]] = defaultdict(set)
+
+        filters = self.filters
+        for i, deck in enumerate(self.deck_list):
+            data = deck._data
+            by_category[filters.categorize_deck_type(getattr(deck, "type", ""))].add(i)
+            by_format[filters.infer_format(data)].add(i)
+            by_era[filters.get_era_from_date(getattr(deck, "releaseDate", ""))].add(i)
+            by_power[filters.filter_by_power_level(data)].add(i)
+
+        self._classification_indices = (by_category, by_format, by_era, by_power)
+
+    def _name_lower(self, deck: "MTGDeck") -> str:
+        """Return the deck's lowercased name, cached per deck.
+
+        MTGDeck uses __slots__, so the cache lives on this filter keyed
+        by object identity; deck_list keeps every deck alive for the
+        lifetime of the filter, so the ids stay valid.
+        """
+        key = id(deck)
+        name = self._name_lc.get(key)
+        if name is None:
+            name = self._name_lc[key] = str(getattr(deck, "name", "")).lower()
+        return name
+
+    def get_filter_statistics(
+        self, fields: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
         """
         Get statistics about the deck list for filter UI population.
 
+        Args:
+            fields: Stat buckets to compute ("categories", "formats",
+                "eras", "power_levels", "types"); None computes all
+
         Returns:
-            Dictionary with counts for each filter category
+            Dictionary with counts for each requested filter category
         """
-        stats = {
-            "categories": {},
-            "formats": {},
-            "eras": {},
-            "power_levels": {},
-            "types": {},
-        }
+        if fields is None:
+            fields = {"categories", "formats", "eras", "power_levels", "types"}
+        # Group-by-then-map: tally the raw type and date values in one
+        # pass, then classify each distinct value once. A thousand decks
+        # share a few dozen types and a few hundred dates, so this runs
+        # the classifiers orders of magnitude less often than per deck.
+        want_categories = "categories" in fields
+        want_formats = "formats" in fields
+        want_eras = "eras" in fields
+        want_power = "power_levels" in fields
+        want_types = "types" in fields
+
+        raw_types = Counter()
+        raw_dates = Counter()
+        formats = Counter()
+        types = Counter()
+
+        infer_format = self.filters.infer_format
 
         for deck in self.deck_list:
-            # Category stats
-            category = self.filters.categorize_deck_type(getattr(deck, "type", ""))
-            stats["categories"][category] = stats["categories"].get(category, 0) + 1
-
-            # Format stats
-            format_name = self.filters.infer_format(deck._data)
-            stats["formats"][format_name] = stats["formats"].get(format_name, 0) + 1
-
-            # Era stats
-            era = self.filters.get_era_from_date(getattr(deck, "releaseDate", ""))
-            stats["eras"][era] = stats["eras"].get(era, 0) + 1
-
-            # Power level stats
-            power = self.filters.filter_by_power_level(deck._data)
-            stats["power_levels"][power] = stats["power_levels"].get(power, 0) + 1
-
-            # Type stats
-            deck_type = getattr(deck, "type", "Unknown")
-            stats["types"][deck_type] = stats["types"].get(deck_type, 0) + 1
+            if want_categories or want_power:
+                raw_types[getattr(deck, "type", "")] += 1
+            if want_eras:
+                raw_dates[getattr(deck, "releaseDate", "")] += 1
+            if want_formats:
+                # Formats depend on the per-deck name too, so no grouping here
+                formats[infer_format(deck._data)] += 1
+            if want_types:
+                types[getattr(deck, "type", "Unknown")] += 1
+
+        stats: Dict[str, Dict[str, int]] = {}
+
+        if want_categories or want_power:
+            categorize = self.filters.categorize_deck_type
+            categories = Counter()
+            power_levels = Counter()
+            for deck_type, count in raw_types.items():
+                categories[categorize(deck_type)] += count
+                power_levels[_power_cached(deck_type)] += count
+            if want_categories:
+                stats["categories"] = dict(categories)
+            if want_power:
+                stats["power_levels"] = dict(power_levels)
+
+        if want_formats:
+            stats["formats"] = dict(formats)
+
+        if want_eras:
+            eras = Counter()
+            for release_date, count in raw_dates.items():
+                eras[_era_cached(release_date)] += count
+            stats["eras"] = dict(eras)
+
+        if want_types:
+            stats["types"] = dict(types)
 
         return stats
 
@@ -393,24 +499,38 @@ class AdvancedDeckFilter:
         Returns:
             List of matching decks
         """
-        if search_fields is None:
-            search_fields = ["name", "type", "code"]
-
         query_lower = query.lower()
-        results = []
 
-        for deck in self.deck_list:
-            match = False
-            for field in search_fields:
-                field_value = str(getattr(deck, field, "")).lower()
-                if query_lower in field_value:
-                    match = True
-                    break
-
-            if match:
-                results.append(deck)
+        # The default field set dominates, so each deck's searchable text
+        # is lowered once into a NUL-joined blob on the first query and
+        # every later query is a single C-level substring scan per deck
+        if search_fields is None:
+            blobs = self._search_blobs
+            if blobs is None:
+                blobs = self._search_blobs = [
+                    "\0".join(
+                        (
+                            str(getattr(deck, "name", "")),
+                            str(getattr(deck, "type", "")),
+                            str(getattr(deck, "code", "")),
+                        )
+                    ).lower()
+                    for deck in self.deck_list
+                ]
+            return [
+                deck
+                for deck, blob in zip(self.deck_list, blobs)
+                if query_lower in blob
+            ]
 
-        return results
+        return [
+            deck
+            for deck in self.deck_list
+            if any(
+                query_lower in str(getattr(deck, field, "")).lower()
+                for field in search_fields
+            )
+        ]
 
     def get_recent_decks(self, limit: int = 50, days: int = 365) -> List["MTGDeck"]:
         """
@@ -423,23 +543,32 @@ class AdvancedDeckFilter:
         Returns:
             List of recent decks sorted by release date
         """
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        recent_decks = []
-        for deck in self.deck_list:
-            release_date_str = getattr(deck, "releaseDate", "")
-            if release_date_str:
-                try:
-                    release_date = datetime.strptime(release_date_str, "%Y-%m-%d")
-                    if release_date >= cutoff_date:
-                        recent_decks.append(deck)
-                except ValueError:
-                    continue
+        # Validate each deck's date once, then compare ISO strings
+        # lexicographically — no per-call strptime over the whole list
+        dates = self._release_dates
+        if dates is None:
+            dates = []
+            for deck in self.deck_list:
+                release_date_str = getattr(deck, "releaseDate", "")
+                if release_date_str:
+                    try:
+                        date.fromisoformat(release_date_str)
+                    except ValueError:
+                        release_date_str = ""
+                dates.append(release_date_str)
+            self._release_dates = dates
+
+        cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
+        recent = [
+            (release_date, deck)
+            for release_date, deck in zip(dates, self.deck_list)
+            if release_date >= cutoff
+        ]
 
         # Sort by release date (newest first)
-        recent_decks.sort(key=lambda x: getattr(x, "releaseDate", ""), reverse=True)
+        recent.sort(key=lambda pair: pair[0], reverse=True)
 
-        return recent_decks[:limit]
+        return [deck for _, deck in recent[:limit]]
 
 
 # Convenience functions for common filtering operations
@@ -4,14 +4,42 @@ Helper to download and manage Cockatrice themes.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
 import zipfile
+import hashlib
+import io
 import tempfile
 import shutil
 import json
+import os
+import re
+
+# orjson parses and serializes several times faster than the stdlib
+# module; fall back transparently when it isn't installed
+try:
+    from orjson import OPT_INDENT_2 as _ORJSON_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _json_dump_pretty(obj) -> bytes:
+        return _orjson_dumps(obj, option=_ORJSON_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -25,10 +53,77 @@ class CockatriceTheme:
     author: str = ""
 
 
-# Cache for GitHub release info to avoid repeated API calls
+# One pooled session for every GitHub API call, gist fetch and archive
+# download; keeps TLS connections alive across the theme refresh and is
+# safe to share between the fetch worker threads
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Strip the markdown punctuation GitHub release bodies tend to carry
+_MD_STRIP_TABLE = str.maketrans("", "", "#*_")
+
+# Match patterns like 1.0, 1.0.0, 2.5.3, etc.
+_VERSION_RE = re.compile(r"^\d+(\.\d+)*$")
+
+# Cache for GitHub release info to avoid repeated API calls; the lock
+# keeps lookups coherent when themes are fetched from worker threads
 _github_cache = {}
+_github_cache_lock = threading.Lock()
 _cache_duration = 300  # 5 minutes cache
 
+# Single-flight registry: one in-flight fetch per cache key, with any
+# concurrent callers waiting on its event instead of duplicating the GET
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Last-seen GitHub rate-limit budget, shared across the fetch workers so
+# they stop issuing doomed requests when the quota is nearly gone
+_rate_limit_lock = threading.Lock()
+_rate_limit_remaining = None
+_rate_limit_reset = 0.0
+
+
+def _github_auth_headers() -> dict:
+    """Authorization header for GitHub calls when a token is configured.
+
+    A token lifts the API quota from 60 to 5000 requests per hour;
+    without one the calls stay anonymous, as before.
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        return {"Authorization": f"Bearer {token}"}
+    return {}
+
+
+def _note_rate_limit(response):
+    """Record the rate-limit budget GitHub reported on a response."""
+    global _rate_limit_remaining, _rate_limit_reset
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is None:
+        return
+    try:
+        remaining = int(remaining)
+        reset = float(response.headers.get("X-RateLimit-Reset", 0))
+    except ValueError:
+        return
+    with _rate_limit_lock:
+        _rate_limit_remaining = remaining
+        _rate_limit_reset = reset
+
+
+def _rate_limit_exhausted() -> bool:
+    """True when the remaining GitHub quota is too low to spend."""
+    with _rate_limit_lock:
+        if _rate_limit_remaining is None or _rate_limit_remaining >= 5:
+            return False
+        return time.time() < _rate_limit_reset
+
 # Remote curated themes configuration
 REMOTE_THEMES_URL = (
     "https://gist.githubusercontent.com/Swiftzn/ad3dbd7384da4162e5f8fbc58f223312/raw"
@@ -36,6 +131,57 @@ REMOTE_THEMES_URL = (
 _remote_themes_cache = {}
 _remote_themes_cache_duration = 86400  # 24 hours cache for remote themes list
 
+# Snapshot of both caches from the previous run, so a fresh process can
+# serve the first theme refresh from disk instead of re-fetching data it
+# had seconds ago. Entries keep their original timestamps and validators,
+# so the normal TTL checks and 304 revalidation still apply. Lives in
+# the per-user cache dir the other persistent caches use, not the
+# shared system temp dir.
+_CACHE_PERSIST_PATH = (
+    Path.home() / ".cockatrice_assistant_cache" / "theme_cache.json"
+)
+
+
+def _load_persisted_caches():
+    """Prewarm the in-process caches from the previous run's snapshot."""
+    try:
+        data = _json_loads(_CACHE_PERSIST_PATH.read_bytes())
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    for name, target in (
+        ("github", _github_cache),
+        ("remote_themes", _remote_themes_cache),
+    ):
+        entries = data.get(name)
+        if not isinstance(entries, dict):
+            continue
+        for key, entry in entries.items():
+            # Entries round-trip as [payload, cache_time, etag, last_modified]
+            if (
+                isinstance(entry, list)
+                and len(entry) == 4
+                and isinstance(entry[1], (int, float))
+            ):
+                target[key] = tuple(entry)
+
+
+def _save_persisted_caches():
+    """Snapshot both caches to disk so the next startup can reuse them."""
+    with _github_cache_lock:
+        github_entries = dict(_github_cache)
+    data = {"github": github_entries, "remote_themes": dict(_remote_themes_cache)}
+    try:
+        _CACHE_PERSIST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _CACHE_PERSIST_PATH.write_bytes(_json_dump_pretty(data))
+    except (OSError, TypeError, ValueError):
+        pass  # Persistence is best-effort; next run just starts cold
+
+
+_load_persisted_caches()
+atexit.register(_save_persisted_caches)
+
 
 def get_latest_github_release(
     repo_owner: str, repo_name: str, use_cache: bool = True
@@ -53,58 +199,185 @@ def get_latest_github_release(
     cache_key = f"{repo_owner}/{repo_name}"
     current_time = time.time()
 
-    # Check cache first if enabled
-    if use_cache and cache_key in _github_cache:
-        cached_data, cache_time = _github_cache[cache_key]
-        if current_time - cache_time < _cache_duration:
+    # Check cache first if enabled; entries are
+    # (result, cache_time, etag, last_modified)
+    with _github_cache_lock:
+        cached = _github_cache.get(cache_key)
+    if use_cache and cached is not None:
+        if current_time - cached[1] < _cache_duration:
             print(f"Using cached release info for {cache_key}")
-            return cached_data
+            return cached[0]
+
+    # Coalesce concurrent misses: the first caller fetches, the rest
+    # wait on its event and reuse the freshly cached result
+    while True:
+        with _inflight_lock:
+            _event = _inflight.get(cache_key)
+            if _event is None:
+                _event = threading.Event()
+                _inflight[cache_key] = _event
+                break
+        _event.wait()
+        with _github_cache_lock:
+            cached = _github_cache.get(cache_key)
+        if cached is not None and time.time() - cached[1] < _cache_duration:
+            print(f"Using cached release info for {cache_key}")
+            return cached[0]
 
     try:
-        api_url = (
-            f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
-        )
+        try:
+            api_url = (
+                f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+            )
+            headers = {
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "CockatriceAssistant/1.0",
+                **_github_auth_headers(),
+            }
+
+            # Don't spend the last few quota tokens on a doomed burst;
+            # serve whatever is cached until the window resets
+            if _rate_limit_exhausted():
+                print("GitHub rate limit nearly exhausted; skipping request")
+                if cached is not None:
+                    return cached[0]
+                return None
+
+            # Revalidate an expired entry instead of re-downloading; 304
+            # responses are free against GitHub's rate limit
+            if cached is not None:
+                if cached[2]:
+                    headers["If-None-Match"] = cached[2]
+                elif cached[3]:
+                    headers["If-Modified-Since"] = cached[3]
+
+            print(f"Fetching latest release info from: {api_url}")
+            response = _SESSION.get(api_url, headers=headers, timeout=10)
+            _note_rate_limit(response)
+
+            if response.status_code == 304 and cached is not None:
+                # Unchanged upstream; refresh the entry's timestamp and keep
+                # serving the cached result
+                with _github_cache_lock:
+                    _github_cache[cache_key] = (
+                        cached[0],
+                        current_time,
+                        cached[2],
+                        cached[3],
+                    )
+                print(f"Release info for {cache_key} unchanged (HTTP 304)")
+                return cached[0]
+
+            if response.status_code == 200:
+                release_data = _json_loads(response.content)
+                result = {
+                    "tag_name": release_data.get("tag_name", ""),
+                    "name": release_data.get("name", ""),
+                    "body": release_data.get("body", ""),
+                    "published_at": release_data.get("published_at", ""),
+                    "zipball_url": release_data.get("zipball_url", ""),
+                    "tarball_url": release_data.get("tarball_url", ""),
+                    "html_url": release_data.get("html_url", ""),
+                }
+
+                # Cache the result with its validators
+                with _github_cache_lock:
+                    _github_cache[cache_key] = (
+                        result,
+                        current_time,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+                return result
+            else:
+                print(f"Failed to fetch release info: HTTP {response.status_code}")
+
+                # Return cached data if available even if expired
+                with _github_cache_lock:
+                    cached = _github_cache.get(cache_key)
+                if cached is not None:
+                    print("Falling back to cached data due to API error")
+                    return cached[0]
+                return None
+
+        except Exception as e:
+            print(f"Error fetching GitHub release info: {e}")
+
+            # Return cached data if available even if expired
+            with _github_cache_lock:
+                cached = _github_cache.get(cache_key)
+            if cached is not None:
+                print("Falling back to cached data due to network error")
+                return cached[0]
+            return None
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+        _event.set()
+
+
+def get_latest_github_releases_batch(repos: List[tuple]) -> Optional[dict]:
+    """Fetch latest-release info for several repositories in one call.
+
+    Builds a single aliased GraphQL query covering every (owner, name)
+    pair and seeds _github_cache with the results, so the per-repo REST
+    lookups afterwards are all cache hits. Returns the mapping of
+    "owner/name" to release info, or None when the query fails (for
+    example unauthenticated, since GitHub's GraphQL endpoint requires a
+    token) — callers then simply fall back to the REST path.
+    """
+    if not repos:
+        return {}
+
+    try:
+        query_parts = [
+            f'r{i}: repository(owner: "{owner}", name: "{name}") '
+            "{ latestRelease { tagName name description publishedAt url } }"
+            for i, (owner, name) in enumerate(repos)
+        ]
+        query = "query { " + " ".join(query_parts) + " }"
         headers = {
-            "Accept": "application/vnd.github.v3+json",
             "User-Agent": "CockatriceAssistant/1.0",
+            **_github_auth_headers(),
         }
 
-        print(f"Fetching latest release info from: {api_url}")
-        response = requests.get(api_url, headers=headers, timeout=10)
+        response = _SESSION.post(
+            "https://api.github.com/graphql",
+            json={"query": query},
+            headers=headers,
+            timeout=10,
+        )
+        _note_rate_limit(response)
+        if response.status_code != 200:
+            print(f"GraphQL batch release query failed: HTTP {response.status_code}")
+            return None
 
-        if response.status_code == 200:
-            release_data = response.json()
+        data = (_json_loads(response.content) or {}).get("data") or {}
+        current_time = time.time()
+        results = {}
+        for i, (owner, name) in enumerate(repos):
+            repo_data = data.get(f"r{i}") or {}
+            release = repo_data.get("latestRelease")
+            if not release:
+                continue
             result = {
-                "tag_name": release_data.get("tag_name", ""),
-                "name": release_data.get("name", ""),
-                "body": release_data.get("body", ""),
-                "published_at": release_data.get("published_at", ""),
-                "zipball_url": release_data.get("zipball_url", ""),
-                "tarball_url": release_data.get("tarball_url", ""),
-                "html_url": release_data.get("html_url", ""),
+                "tag_name": release.get("tagName", ""),
+                "name": release.get("name", ""),
+                "body": release.get("description", ""),
+                "published_at": release.get("publishedAt", ""),
+                "zipball_url": "",
+                "tarball_url": "",
+                "html_url": release.get("url", ""),
             }
+            cache_key = f"{owner}/{name}"
+            results[cache_key] = result
+            with _github_cache_lock:
+                _github_cache[cache_key] = (result, current_time, None, None)
 
-            # Cache the result
-            _github_cache[cache_key] = (result, current_time)
-            return result
-        else:
-            print(f"Failed to fetch release info: HTTP {response.status_code}")
-
-            # Return cached data if available even if expired
-            if cache_key in _github_cache:
-                print("Falling back to cached data due to API error")
-                cached_data, _ = _github_cache[cache_key]
-                return cached_data
-            return None
+        return results
 
     except Exception as e:
-        print(f"Error fetching GitHub release info: {e}")
-
-        # Return cached data if available even if expired
-        if cache_key in _github_cache:
-            print("Falling back to cached data due to network error")
-            cached_data, _ = _github_cache[cache_key]
-            return cached_data
+        print(f"Error in GraphQL batch release query: {e}")
         return None
 
 
@@ -131,60 +404,101 @@ def get_remote_curated_themes_list() -> Optional[List[dict]]:
     cache_key = "remote_themes"
     current_time = time.time()
 
-    # Check cache first
-    if cache_key in _remote_themes_cache:
-        cached_data, cache_time = _remote_themes_cache[cache_key]
-        if current_time - cache_time < _remote_themes_cache_duration:
+    # Check cache first; entries are
+    # (themes_list, cache_time, etag, last_modified)
+    cached = _remote_themes_cache.get(cache_key)
+    if cached is not None:
+        if current_time - cached[1] < _remote_themes_cache_duration:
             print("Using cached remote themes list")
-            return cached_data
+            return cached[0]
+
+    # Coalesce concurrent misses: the first caller fetches, the rest
+    # wait on its event and reuse the freshly cached result
+    while True:
+        with _inflight_lock:
+            _event = _inflight.get(cache_key)
+            if _event is None:
+                _event = threading.Event()
+                _inflight[cache_key] = _event
+                break
+        _event.wait()
+        cached = _remote_themes_cache.get(cache_key)
+        if cached is not None and time.time() - cached[1] < _remote_themes_cache_duration:
+            print("Using cached remote themes list")
+            return cached[0]
 
     try:
-        print(f"Fetching remote curated themes from: {REMOTE_THEMES_URL}")
-        headers = {
-            "User-Agent": "CockatriceAssistant/1.0",
-            "Accept": "application/json",
-        }
-
-        response = requests.get(REMOTE_THEMES_URL, headers=headers, timeout=10)
-
-        if response.status_code == 200:
-            themes_data = response.json()
-
-            # Validate the JSON structure
-            if isinstance(themes_data, dict) and "themes" in themes_data:
-                themes_list = themes_data["themes"]
-                if isinstance(themes_list, list):
-                    print(f"Successfully fetched {len(themes_list)} remote themes")
+        try:
+            print(f"Fetching remote curated themes from: {REMOTE_THEMES_URL}")
+            headers = {
+                "User-Agent": "CockatriceAssistant/1.0",
+                "Accept": "application/json",
+            }
 
-                    # Cache the result
-                    _remote_themes_cache[cache_key] = (themes_list, current_time)
-                    return themes_list
+            # Revalidate the expired list instead of re-downloading it
+            if cached is not None:
+                if cached[2]:
+                    headers["If-None-Match"] = cached[2]
+                elif cached[3]:
+                    headers["If-Modified-Since"] = cached[3]
+
+            response = _SESSION.get(REMOTE_THEMES_URL, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cached is not None:
+                print("Remote themes list unchanged (HTTP 304)")
+                _remote_themes_cache[cache_key] = (
+                    cached[0],
+                    current_time,
+                    cached[2],
+                    cached[3],
+                )
+                return cached[0]
+
+            if response.status_code == 200:
+                themes_data = _json_loads(response.content)
+
+                # Validate the JSON structure
+                if isinstance(themes_data, dict) and "themes" in themes_data:
+                    themes_list = themes_data["themes"]
+                    if isinstance(themes_list, list):
+                        print(f"Successfully fetched {len(themes_list)} remote themes")
+
+                        # Cache the result with its validators
+                        _remote_themes_cache[cache_key] = (
+                            themes_list,
+                            current_time,
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                        )
+                        return themes_list
+                    else:
+                        print("Invalid remote themes format: 'themes' is not a list")
                 else:
-                    print("Invalid remote themes format: 'themes' is not a list")
-            else:
-                print("Invalid remote themes format: missing 'themes' key")
+                    print("Invalid remote themes format: missing 'themes' key")
 
-        else:
-            print(f"Failed to fetch remote themes: HTTP {response.status_code}")
+            else:
+                print(f"Failed to fetch remote themes: HTTP {response.status_code}")
 
-        # Return cached data if available even if expired
-        if cache_key in _remote_themes_cache:
-            print("Falling back to cached remote themes due to fetch error")
-            cached_data, _ = _remote_themes_cache[cache_key]
-            return cached_data
+            # Return cached data if available even if expired
+            if cached is not None:
+                print("Falling back to cached remote themes due to fetch error")
+                return cached[0]
 
-        return None
+            return None
 
-    except Exception as e:
-        print(f"Error fetching remote curated themes: {e}")
+        except Exception as e:
+            print(f"Error fetching remote curated themes: {e}")
 
-        # Return cached data if available even if expired
-        if cache_key in _remote_themes_cache:
-            print("Falling back to cached remote themes due to network error")
-            cached_data, _ = _remote_themes_cache[cache_key]
-            return cached_data
+            # Return cached data if available even if expired
+            if cached is not None:
+                print("Falling back to cached remote themes due to network error")
+                return cached[0]
 
-        return None
+            return None
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+        _event.set()
 
 
 def check_themes_list_update() -> dict:
@@ -205,24 +519,35 @@ def check_themes_list_update() -> dict:
         cache_key = "remote_themes"
         current_version = "0.0.0"  # Default if no cache
 
-        if cache_key in _remote_themes_cache:
-            cached_data, cache_time = _remote_themes_cache[cache_key]
+        cached = _remote_themes_cache.get(cache_key)
+        if cached is not None:
             # Try to extract version from cached data
-            if isinstance(cached_data, list) and len(cached_data) > 0:
+            if isinstance(cached[0], list) and len(cached[0]) > 0:
                 # Check if there's version metadata in the first theme or elsewhere
                 current_version = "cached"
 
-        # Force fetch latest remote themes (ignore cache)
+        # Force fetch latest remote themes (ignore cache TTL), but let
+        # the server answer 304 off the cached ETag so the unchanged
+        # case moves no body and skips the JSON parse entirely
         print("Checking for themes list updates...")
         headers = {
             "User-Agent": "CockatriceAssistant/1.0",
             "Accept": "application/json",
         }
+        if cached is not None and cached[2]:
+            headers["If-None-Match"] = cached[2]
 
-        response = requests.get(REMOTE_THEMES_URL, headers=headers, timeout=10)
+        response = _SESSION.get(REMOTE_THEMES_URL, headers=headers, timeout=10)
+
+        if response.status_code == 304 and cached is not None:
+            theme_count = len(cached[0])
+            result["current_version"] = current_version
+            result["latest_version"] = current_version
+            result["message"] = f"Themes list is up to date ({theme_count} themes)"
+            return result
 
         if response.status_code == 200:
-            themes_data = response.json()
+            themes_data = _json_loads(response.content)
 
             if isinstance(themes_data, dict):
                 latest_version = themes_data.get("version", "unknown")
@@ -232,14 +557,13 @@ def check_themes_list_update() -> dict:
                 result["latest_version"] = latest_version
 
                 # Simple check - if we don't have the exact same data, consider it an update
-                if cache_key not in _remote_themes_cache:
+                if cached is None:
                     result["update_available"] = True
                     result["message"] = (
                         f"New themes list available with {theme_count} themes"
                     )
                 else:
-                    cached_data, _ = _remote_themes_cache[cache_key]
-                    if len(cached_data) != theme_count:
+                    if len(cached[0]) != theme_count:
                         result["update_available"] = True
                         result["message"] = (
                             f"Updated themes list available ({theme_count} themes)"
@@ -346,10 +670,8 @@ def create_github_theme(
             else:
                 description = release_info.get("body", "").strip()
                 if description:
-                    # Clean up markdown
-                    description = (
-                        description.replace("#", "").replace("*", "").replace("_", "")
-                    )
+                    # Clean up markdown in one C-level pass
+                    description = description.translate(_MD_STRIP_TABLE)
                     if len(description) > 150:
                         description = description[:147] + "..."
                 else:
@@ -385,17 +707,42 @@ def get_curated_themes() -> List[CockatriceTheme]:
     if remote_themes:
         print(f"Processing {len(remote_themes)} remote theme definitions")
 
-        for theme_def in remote_themes:
-            try:
-                theme = create_theme_from_definition(theme_def)
-                if theme:
-                    themes.append(theme)
-                else:
-                    print(
-                        f"Failed to create theme from definition: {theme_def.get('name', 'Unknown')}"
-                    )
-            except Exception as e:
-                print(f"Error processing theme definition: {e}")
+        # One GraphQL query can answer every release lookup at a single
+        # rate-limit cost; when it fails the per-repo REST path below
+        # still resolves everything
+        get_latest_github_releases_batch(
+            [
+                (theme_def["repo_owner"], theme_def["repo_name"])
+                for theme_def in remote_themes
+                if theme_def.get("repo_owner") and theme_def.get("repo_name")
+            ]
+        )
+
+        # Each definition costs a GitHub API round trip, so resolve them
+        # concurrently; ten workers stays polite to the API while the
+        # results keep the remote list's ordering
+        results: List[Optional[CockatriceTheme]] = [None] * len(remote_themes)
+        with ThreadPoolExecutor(
+            max_workers=min(10, len(remote_themes))
+        ) as executor:
+            futures = {
+                executor.submit(create_theme_from_definition, theme_def): i
+                for i, theme_def in enumerate(remote_themes)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"Error processing theme definition: {e}")
+
+        for i, theme in enumerate(results):
+            if theme:
+                themes.append(theme)
+            else:
+                print(
+                    f"Failed to create theme from definition: {remote_themes[i].get('name', 'Unknown')}"
+                )
     else:
         # Fallback to hardcoded themes if remote fetch fails
         print("Remote themes unavailable, using fallback themes")
@@ -421,59 +768,100 @@ def download_template(url: str, dest_folder: str) -> Path:
     """Download a file from url and save into dest_folder. Returns path to saved file.
     This is a minimal placeholder; no validation beyond HTTP status.
     """
-    resp = requests.get(url, stream=True, timeout=30)
-    resp.raise_for_status()
     fname = url.split("/")[-1] or "template.bin"
     dest = Path(dest_folder) / fname
-    with open(dest, "wb") as f:
-        for chunk in resp.iter_content(1024 * 8):
-            if chunk:
-                f.write(chunk)
+    with _SESSION.get(url, stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # Transparently inflate gzip bodies
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=1 << 20)
     return dest
 
 
-def _find_existing_theme_versions(themes_path: Path, theme_name: str) -> List[dict]:
-    """Find all existing versions of a theme in the themes folder."""
-    existing_versions = []
+# Folder-scan results per themes path, keyed by the directory's
+# mtime_ns so installs and removals invalidate the entry naturally
+_theme_scan_cache = {}
 
-    # Look for folders matching theme name patterns
-    for folder in themes_path.iterdir():
-        if not folder.is_dir():
-            continue
 
-        folder_name = folder.name
+def _scan_all_theme_versions(themes_path: Path) -> dict:
+    """Bucketize every theme folder under themes_path by theme name.
 
-        # Check for exact match (no version)
-        if folder_name == theme_name:
-            existing_versions.append(
-                {
-                    "path": folder,
-                    "version": "0.0.0",  # Default version for unversioned themes
-                    "folder_name": folder_name,
-                }
-            )
-        # Check for versioned match (ThemeName_vX.X.X)
-        elif folder_name.startswith(f"{theme_name}_v"):
-            version_part = folder_name[len(f"{theme_name}_v") :]
-            if _is_valid_version(version_part):
-                existing_versions.append(
+    One scandir pass covers all themes: versioned folders
+    (ThemeName_vX.X.X) bucket under their theme name, plain folders
+    bucket under their own name as version 0.0.0. The result is cached
+    against the directory's mtime so installing N themes scans the
+    folder once instead of once per theme.
+    """
+    try:
+        mtime_ns = os.stat(themes_path).st_mtime_ns
+    except OSError:
+        return {}
+
+    cached = _theme_scan_cache.get(str(themes_path))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    buckets = {}
+    with os.scandir(themes_path) as entries:
+        for entry in entries:
+            folder_name = entry.name
+            theme_name, sep, version_part = folder_name.rpartition("_v")
+
+            # Versioned match (ThemeName_vX.X.X)
+            if sep and _is_valid_version(version_part):
+                if entry.is_dir(follow_symlinks=False):
+                    buckets.setdefault(theme_name, []).append(
+                        {
+                            "path": Path(entry.path),
+                            "version": version_part,
+                            "version_tuple": _parse_version(version_part),
+                            "folder_name": folder_name,
+                        }
+                    )
+            # Unversioned folder: its own bucket with a default version
+            elif entry.is_dir(follow_symlinks=False):
+                buckets.setdefault(folder_name, []).append(
                     {
-                        "path": folder,
-                        "version": version_part,
+                        "path": Path(entry.path),
+                        "version": "0.0.0",  # Default version for unversioned themes
+                        "version_tuple": (0, 0, 0),
                         "folder_name": folder_name,
                     }
                 )
 
-    return existing_versions
+    _theme_scan_cache[str(themes_path)] = (mtime_ns, buckets)
+    return buckets
+
+
+def _find_existing_theme_versions(
+    themes_path: Path, theme_name: str
+) -> Tuple[List[dict], Optional[dict]]:
+    """Find all existing versions of a theme in the themes folder.
+
+    Returns the version-info list plus the latest entry, served from
+    the shared single-pass folder scan.
+    """
+    existing_versions = _scan_all_theme_versions(themes_path).get(theme_name, [])
+    latest = (
+        max(existing_versions, key=lambda info: info["version_tuple"])
+        if existing_versions
+        else None
+    )
+    return existing_versions, latest
 
 
 def _is_valid_version(version_str: str) -> bool:
     """Check if a string is a valid version number."""
-    import re
+    return _VERSION_RE.match(version_str) is not None
 
-    # Match patterns like 1.0, 1.0.0, 2.5.3, etc.
-    pattern = r"^\d+(\.\d+)*$"
-    return bool(re.match(pattern, version_str))
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a version string into a sortable tuple of integers."""
+    try:
+        return tuple(int(x) for x in version.split("."))
+    except ValueError:
+        return (0, 0, 0)  # Fallback for invalid versions
 
 
 def _get_latest_version(versions: List[dict]) -> dict:
@@ -481,36 +869,102 @@ def _get_latest_version(versions: List[dict]) -> dict:
     if not versions:
         return None
 
-    # Sort by version number (descending)
+    # Sort by the version tuples computed when the folder was scanned
     def version_key(version_info):
-        version = version_info["version"]
-        # Convert version string to tuple of integers for proper sorting
-        try:
-            return tuple(int(x) for x in version.split("."))
-        except ValueError:
-            return (0, 0, 0)  # Fallback for invalid versions
+        version_tuple = version_info.get("version_tuple")
+        if version_tuple is None:
+            version_tuple = _parse_version(version_info["version"])
+        return version_tuple
 
     return max(versions, key=version_key)
 
 
 def _compare_versions(version1: str, version2: str) -> int:
     """Compare two version strings. Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal."""
+    v1_tuple = _parse_version(version1)
+    v2_tuple = _parse_version(version2)
+    return (v1_tuple > v2_tuple) - (v1_tuple < v2_tuple)
 
-    def version_tuple(v):
-        try:
-            return tuple(int(x) for x in v.split("."))
-        except ValueError:
-            return (0, 0, 0)
 
-    v1_tuple = version_tuple(version1)
-    v2_tuple = version_tuple(version2)
+# Archives with at least this many members are extracted in parallel
+_PARALLEL_EXTRACT_MIN_MEMBERS = 32
 
-    if v1_tuple > v2_tuple:
-        return 1
-    elif v1_tuple < v2_tuple:
-        return -1
-    else:
-        return 0
+# 1 MiB copy buffer when streaming members to disk; the decompressed
+# stream is chunked through Python, so a large buffer amortizes the
+# per-iteration interpreter cost for big theme assets
+_EXTRACT_COPY_BUFSIZE = 1024 * 1024
+
+
+def _write_member(zf: zipfile.ZipFile, member: zipfile.ZipInfo, dest: Path):
+    """Stream one archive member straight to its destination file."""
+    with zf.open(member) as src, open(dest / member.filename, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=_EXTRACT_COPY_BUFSIZE)
+
+
+def _extract_archive(blob: bytes, dest: Path, strip_prefix: str = ""):
+    """Extract an in-memory zip archive into dest.
+
+    strip_prefix removes a leading folder (e.g. the single root GitHub
+    wraps archives in) from every member, so contents land directly in
+    dest with no staging area or post-extract move.
+
+    Archives with many members fan out across a small thread pool:
+    zlib's inflate runs without the GIL, so wide theme bundles of small
+    files decompress on several cores. ZipFile handles aren't
+    thread-safe, so each worker opens its own view over the shared
+    bytes. Directories are created up front to keep the workers free of
+    mkdir races.
+    """
+    with zipfile.ZipFile(io.BytesIO(blob)) as zip_ref:
+        members = zip_ref.infolist()
+
+    if strip_prefix:
+        prefix_len = len(strip_prefix)
+        stripped = []
+        for member in members:
+            if not member.filename.startswith(strip_prefix):
+                continue
+            member.filename = member.filename[prefix_len:]
+            if member.filename:
+                stripped.append(member)
+        members = stripped
+
+    # Member names come straight from remote archives, so drop anything
+    # that would land outside dest (absolute paths or ".." traversal)
+    # before any directory or file is created from them
+    dest_root = os.path.abspath(dest)
+    safe_members = []
+    for member in members:
+        target = os.path.abspath(os.path.join(dest_root, member.filename))
+        if os.path.commonpath((dest_root, target)) != dest_root:
+            print(f"Skipping unsafe archive member: {member.filename}")
+            continue
+        safe_members.append(member)
+    members = safe_members
+
+    for member in members:
+        target = dest / member.filename
+        (target if member.is_dir() else target.parent).mkdir(
+            parents=True, exist_ok=True
+        )
+
+    workers = min(os.cpu_count() or 1, 8)
+    file_members = [member for member in members if not member.is_dir()]
+    if workers < 2 or len(file_members) < _PARALLEL_EXTRACT_MIN_MEMBERS:
+        with zipfile.ZipFile(io.BytesIO(blob)) as zip_ref:
+            for member in file_members:
+                _write_member(zip_ref, member, dest)
+        return
+
+    def extract_shard(shard):
+        with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+            for member in shard:
+                _write_member(zf, member, dest)
+
+    shards = [file_members[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(extract_shard, shard) for shard in shards]:
+            future.result()
 
 
 def download_and_install_theme(theme: CockatriceTheme, themes_folder: str) -> Path:
@@ -535,11 +989,12 @@ def download_and_install_theme(theme: CockatriceTheme, themes_folder: str) -> Pa
     theme_folder = themes_path / theme_folder_name
 
     # Check for existing versions and handle updates
-    existing_versions = _find_existing_theme_versions(themes_path, theme.name)
+    existing_versions, latest_installed = _find_existing_theme_versions(
+        themes_path, theme.name
+    )
 
     if existing_versions:
         print(f"Found existing versions of {theme.name}: {existing_versions}")
-        latest_installed = _get_latest_version(existing_versions)
 
         if (
             theme.version
@@ -565,73 +1020,68 @@ def download_and_install_theme(theme: CockatriceTheme, themes_folder: str) -> Pa
     if theme_folder.exists():
         shutil.rmtree(theme_folder)
 
-    # Download ZIP to temporary location
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Download the ZIP file
-        print(f"Downloading {theme.name} from {theme.download_url}...")
-        resp = requests.get(theme.download_url, stream=True, timeout=30)
-        resp.raise_for_status()
-
-        zip_path = temp_path / f"{theme.name}.zip"
-        with open(zip_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-
-        # Extract ZIP file
-        print(f"Extracting {theme.name}...")
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            extract_path = temp_path / "extracted"
-            zip_ref.extractall(extract_path)
-
-            # Find the theme files (usually in a subfolder)
-            extracted_items = list(extract_path.iterdir())
-
-            if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                # If there's only one folder, use its contents
-                source_folder = extracted_items[0]
-            else:
-                # Use the extraction root
-                source_folder = extract_path
-
-            # Copy theme files to themes folder
-            theme_folder.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files from source to theme folder
-            for item in source_folder.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, theme_folder)
-                elif item.is_dir():
-                    shutil.copytree(item, theme_folder / item.name, dirs_exist_ok=True)
+    # Download ZIP into a spooled buffer and extract from there; small
+    # themes never touch the disk as an archive at all, large ones spill
+    # to a temp file automatically
+    print(f"Downloading {theme.name} from {theme.download_url}...")
+    content_hash = hashlib.blake2b(digest_size=16)
+    with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as zip_buf:
+        with _SESSION.get(theme.download_url, stream=True, timeout=30) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True  # Transparently inflate gzip bodies
+            raw_read = resp.raw.read
+            # Hash the archive in the same pass as the write, so the
+            # integrity record costs no extra read of the data
+            while True:
+                buf = raw_read(1 << 20)
+                if not buf:
+                    break
+                content_hash.update(buf)
+                zip_buf.write(buf)
+        zip_buf.seek(0)
+        blob = zip_buf.read()
+
+    # Extract straight into the theme folder; a single-root GitHub
+    # archive has that root stripped from every member, so nothing is
+    # staged elsewhere and no post-extract move is needed
+    print(f"Extracting {theme.name}...")
+    with zipfile.ZipFile(io.BytesIO(blob)) as zip_ref:
+        roots = {name.split("/", 1)[0] for name in zip_ref.namelist() if name}
+
+    theme_folder.mkdir(parents=True, exist_ok=True)
+    strip_prefix = next(iter(roots)) + "/" if len(roots) == 1 else ""
+    _extract_archive(blob, theme_folder, strip_prefix)
 
     # Create version info file for future update detection
-    _create_version_info_file(theme_folder, theme)
+    _create_version_info_file(theme_folder, theme, content_hash.hexdigest())
+
+    # The folder contents changed; drop the scan cache for this path
+    _theme_scan_cache.pop(str(themes_path), None)
 
     print(f"Theme '{theme.name}' v{theme.version} installed to: {theme_folder}")
     return theme_folder
 
 
-def _create_version_info_file(theme_folder: Path, theme: CockatriceTheme):
+def _create_version_info_file(
+    theme_folder: Path, theme: CockatriceTheme, content_hash: Optional[str] = None
+):
     """Create a version info file in the theme folder for update tracking."""
-    import json
-
     version_info = {
         "name": theme.name,
         "version": theme.version,
         "author": theme.author,
         "description": theme.description,
         "download_url": theme.download_url,
-        "installed_date": str(
-            Path().ctime() if hasattr(Path(), "ctime") else "unknown"
-        ),
+        # The old Path().ctime() hasattr dance always produced "unknown";
+        # record the actual install time instead
+        "installed_date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
+    if content_hash:
+        version_info["archive_blake2b"] = content_hash
 
     version_file = theme_folder / ".theme_info.json"
     try:
-        with open(version_file, "w", encoding="utf-8") as f:
-            json.dump(version_info, f, indent=2)
+        version_file.write_bytes(_json_dump_pretty(version_info))
         print(f"Created version info file: {version_file}")
     except Exception as e:
         print(f"Warning: Could not create version info file: {e}")
@@ -639,13 +1089,11 @@ def _create_version_info_file(theme_folder: Path, theme: CockatriceTheme):
 
 def get_installed_theme_info(theme_folder: Path) -> dict:
     """Get version info from an installed theme folder."""
-    import json
-
     version_file = theme_folder / ".theme_info.json"
     if version_file.exists():
         try:
-            with open(version_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(version_file, "rb") as f:
+                return _json_loads(f.read())
         except Exception as e:
             print(f"Warning: Could not read version info file: {e}")
 